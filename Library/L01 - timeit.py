@@ -1,22 +1,42 @@
 from time import perf_counter, sleep
 from random import random
+from math import ceil
+from statistics import median
 
-def timeit(n):  # Accept n as an argument
+def summarize(times: list[float]) -> dict[str, float]:
+    ordered = sorted(times)
+    p95 = ordered[max(0, ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "min": ordered[0],
+        "median": median(ordered),
+        "p95": p95,
+        "mean": sum(ordered) / len(ordered),
+    }
+
+def timeit(n, setup=None, verbose=True):  # Accept n as an argument
     def decorator(f):  # This is the actual decorator
         def wrapper(*args, **kwargs):
             exec_time = 0
             return_value = None #
+            times = []
             for i in range(n):
+                # setup() genera argumentos nuevos para cada iteracion (e.g. una copia de la lista a ordenar)
+                if setup is not None:
+                    args = setup()
                 start = perf_counter()
                 return_value = f(
                     *args, **kwargs
                 )  # Important to calculate the return value inside the loop
                 end = perf_counter()
                 exec_time += end - start
-            print(
-                f"@timeit Function {f.__name__}: Average execution time {exec_time / n} over {n} iterations."
-            )
+                times.append(end - start)
+            wrapper.stats = summarize(times)
+            if verbose:
+                print(
+                    f"@timeit Function {f.__name__}: Average execution time {exec_time / n} over {n} iterations."
+                )
             return return_value
+        wrapper.stats = None
         return wrapper
     return decorator  # Return the decorator
 
@@ -27,3 +47,5 @@ if __name__ == "__main__":
         sleep(5 * random())
 
     example_function()
+    print(example_function.stats)
+    # {'min': ..., 'median': ..., 'p95': ..., 'mean': ...}
@@ -1,25 +1,30 @@
 from typing import TypeVar, Callable
+from sort_keys import identity, cached_sort, sort_key
 
 T = TypeVar("T")
 
 def insertion_sort(
-    A: list[T], key: Callable = lambda x: x, reverse: bool = False
+    A: list[T], key: Callable = identity, reverse: bool = False, cache_keys: bool = True
 ) -> None:
+    if cache_keys and key is not identity:
+        cached_sort(A, insertion_sort, key, reverse)
+        return
+    key = sort_key(key)
 
+    # Estable en ambos sentidos: solo se recorren los elementos estrictamente mayores
+    # (o menores con reverse), asi los empates nunca se cruzan
     # Se empieza desde 1, porque no se puede ordenar un solo elemento
     for i in range(1, len(A)):
         current = A[i]
+        current_key = key(current)
         j = i-1
 
-        while j >= 0 and key(A[j]) > key(current):
+        while j >= 0 and (key(A[j]) > current_key if not reverse else key(A[j]) < current_key):
             A[j+1] = A[j]
             j -= 1
 
         A[j+1] = current
 
-    if reverse:
-        A.reverse()
-
 if __name__ == "__main__":
 
     A = [3, 2, 5, 1, 9, 0, 8, 6, 7, 4]
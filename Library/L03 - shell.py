@@ -1,16 +1,155 @@
 from typing import TypeVar, Callable
-from math import ceil, log
+from sort_keys import identity, cached_sort, sort_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 T = TypeVar("T")
 
+# Secuencias de gaps; cada una regresa los gaps menores a n en orden ascendente
+def shell_gaps(n: int) -> list[int]:
+    # La original de Shell: n/2, n/4, ..., 1 (peor caso O(n^2))
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps[::-1]
+
+def ciura_gaps(n: int) -> list[int]:
+    # Encontrada empiricamente; se extiende multiplicando por 2.25
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [g for g in gaps if g < n] or [1]
+
+def tokuda_gaps(n: int) -> list[int]:
+    # h_k = ceil((9 * (9/4)^k - 4) / 5)
+    gaps = []
+    k = 0
+    while True:
+        h = -(-(9 * 9**k - 4 * 4**k) // (5 * 4**k))
+        if h >= n and gaps:
+            return gaps
+        gaps.append(h)
+        k += 1
+
+def sedgewick_gaps(n: int) -> list[int]:
+    # 1, 8, 23, 77, 281, ...: 4^k + 3 * 2^(k-1) + 1, peor caso O(n^(4/3))
+    gaps = [1]
+    k = 1
+    while 4**k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4**k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps
+
+def pratt_gaps(n: int) -> list[int]:
+    # Numeros 2^p 3^q: O(n log^2 n) en todos los casos, pero con muchas pasadas
+    gaps = []
+    power2 = 1
+    while power2 < max(n, 2):
+        gap = power2
+        while gap < max(n, 2):
+            gaps.append(gap)
+            gap *= 3
+        power2 *= 2
+    return sorted(gaps)
+
+GAPS = {
+    "ciura": ciura_gaps,
+    "tokuda": tokuda_gaps,
+    "sedgewick": sedgewick_gaps,
+    "pratt": pratt_gaps,
+    "shell": shell_gaps,
+}
+
+# Ciura fue la mas rapida (empatada con Tokuda en datos aleatorios) en benchmark.py --case L03
+DEFAULT_GAPS = "ciura"
+
+# En arreglos de NumPy los gaps de al menos VECTOR_GAP se procesan por filas de gap elementos:
+# las columnas de una fila son independientes y se insertan juntas, de VECTOR_BLOCK en VECTOR_BLOCK.
+# La memoria extra es O(VECTOR_BLOCK), sin copiar el arreglo
+VECTOR_GAP = 512
+VECTOR_BLOCK = 4096
+
+def _shell_sort_ndarray(A, gaps: list[int], reverse: bool) -> None:
+    n = len(A)
+    # Un memoryview sobre el mismo buffer da escalares de Python (mucho mas rapidos que los de NumPy).
+    # Solo para enteros y float32/float64: memoryview no maneja float16, fechas, complejos ni cadenas
+    fast = A.dtype.kind in "iu" or (A.dtype.kind == "f" and A.dtype.itemsize in (4, 8))
+    M = memoryview(A) if fast and A.flags.c_contiguous and A.flags.writeable and A.dtype.isnative else A
+    for gap in gaps:
+        if gap < VECTOR_GAP:
+            for i in range(gap, n):
+                temp = M[i]
+                j = i
+                while j >= gap and (M[j - gap] < temp if reverse else M[j - gap] > temp):
+                    M[j] = M[j - gap]
+                    j -= gap
+                M[j] = temp
+            continue
+
+        for start in range(gap, n, gap):
+            end = min(start + gap, n)
+            for lo in range(start, end, VECTOR_BLOCK):
+                hi = min(lo + VECTOR_BLOCK, end)
+                temp = A[lo:hi].copy()
+                # pos: hueco de cada columna que sigue bajando; idx: su valor en temp
+                pos = np.arange(lo, hi)
+                idx = np.arange(hi - lo)
+                while pos.size and pos[0] >= gap:
+                    prev = A[pos - gap]
+                    move = prev < temp[idx] if reverse else prev > temp[idx]
+                    stop = ~move
+                    A[pos[stop]] = temp[idx[stop]]
+                    A[pos[move]] = prev[move]
+                    pos = pos[move] - gap
+                    idx = idx[move]
+                A[pos] = temp[idx]
+
 def shell_sort(
-    A: list[T], key: Callable = lambda x: x, reverse: bool = False
+    A: list[T],
+    key: Callable = identity,
+    reverse: bool = False,
+    cache_keys: bool = True,
+    gaps: str | Callable = DEFAULT_GAPS,
 ) -> list[T]:
+    # No es estable: los gaps mueven elementos por encima de sus empates.
+    # Con key y cache_keys=True si lo es, porque el indice desempata
+    if cache_keys and key is not identity:
+        return cached_sort(A, shell_sort, key, reverse, gaps=gaps)
+    key = sort_key(key)
+
+    if isinstance(gaps, str):
+        if gaps not in GAPS:
+            raise ValueError(f"Unknown gap sequence: {gaps}")
+        gaps = GAPS[gaps]
 
     n = len(A)
-    gap = n // 2  # Se inicia a la mitad de la lista
+    if np is not None and isinstance(A, np.ndarray):
+        if A.dtype == object:
+            # Objetos de Python: no hay comparacion vectorizada, se ordena una lista
+            values = A.tolist()
+            shell_sort(values, key, reverse, cache_keys, gaps)
+            A[:] = values
+            return A
+        if key is identity:
+            _shell_sort_ndarray(A, list(reversed(gaps(n))), reverse)
+            return A
+
+    for gap in reversed(gaps(n)):
+        if key is identity and not reverse:
+            for i in range(gap, n):
+                temp = A[i]
+                j = i
+                while j >= gap and A[j - gap] > temp:
+                    A[j] = A[j - gap]
+                    j -= gap
+                A[j] = temp
+            continue
 
-    while gap > 0:
         for i in range(gap, n):
             temp = A[i]
             temp_key = key(temp)
@@ -23,8 +162,6 @@ def shell_sort(
 
             A[j] = temp
 
-        gap //= 2
-
     return A
 
 if __name__ == "__main__":
@@ -44,3 +181,10 @@ if __name__ == "__main__":
     shell_sort(B, key=lambda x: x[1])
     print(B)
     # [(2, 0), (8, 1), (0, 2), (9, 3), (6, 4), (5, 5), (1, 6), (4, 7), (3, 8), (7, 9)]
+
+    print(ciura_gaps(1000), tokuda_gaps(1000), sedgewick_gaps(1000))
+    # [1, 4, 10, 23, 57, 132, 301, 701] [1, 4, 9, 20, 46, 103, 233, 525] [1, 8, 23, 77, 281]
+    C = list(range(20, 0, -1))
+    shell_sort(C, gaps="pratt")
+    print(C == sorted(C))
+    # True
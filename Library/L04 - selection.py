@@ -1,10 +1,17 @@
 from typing import TypeVar, Callable
+from sort_keys import identity, cached_sort, sort_key
 
 T = TypeVar("T")
 
 def selection_sort(
-    A: list[T], key: Callable = lambda x: x, reverse: bool = False
+    A: list[T], key: Callable = identity, reverse: bool = False, cache_keys: bool = True
 ) -> None:
+    # No es estable: el intercambio puede saltar sobre un empate.
+    # Con key y cache_keys=True si lo es, porque el indice desempata
+    if cache_keys and key is not identity:
+        cached_sort(A, selection_sort, key, reverse)
+        return
+    key = sort_key(key)
 
     n = len(A)
     # Se recorre hasta el penúltimo elemento
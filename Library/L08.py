@@ -1,16 +1,10 @@
+from array import array
 from enum import Enum
 from typing import TypeVar, Callable, List
+from sort_keys import identity, cached_sort, sort_key
+import heap_core
 T = TypeVar("T")
 
-def parent(i: int) -> int:
-    return i // 2
-
-def left(i: int) -> int:
-    return i * 2
-
-def right(i: int) -> int:
-    return (i * 2) + 1
-
 class HeapType(Enum):
     MAX = 0
     MIN = 1
@@ -20,16 +14,35 @@ class Heap:
         self,
         A: List[T],
         heapType: HeapType = HeapType.MAX,
-        key: Callable[[T], any] = lambda x: x,
+        key: Callable[[T], any] = identity,
+        arity: int = 2,
+        compact: bool = False,
     ) -> None:
-        self._heap = [None] + list(A)  # Make the array 1-indexed
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        # Los items y sus llaves (calculadas una vez) van en listas paralelas, 0-indexadas.
+        # compact guarda las prioridades (numericas) en un array('d'): 8 bytes por llave
+        # en lugar de un puntero mas un objeto float
+        self._items = list(A)
+        if compact:
+            self._keys = array("d", (key(x) for x in self._items))
+        else:
+            self._keys = [key(x) for x in self._items]
         self._key = key
-        self.heap_size = len(A)
         self.type = heapType
+        self.arity = arity
+        self.compact = compact
         self.build_heap()
 
     def __repr__(self) -> str:
-        return str(self._heap[1 : self.heap_size + 1])
+        return str(self._items)
+
+    @property
+    def heap_size(self) -> int:
+        return len(self._items)
+
+    def _is_max(self) -> bool:
+        return self.type == HeapType.MAX
 
     def _compare(self, a: T, b: T) -> bool:
         if self.type == HeapType.MAX:
@@ -38,71 +51,52 @@ class Heap:
             return self._key(a) <= self._key(b)
 
     def assert_heap_property(self) -> None:
-        for i in range(2, self.heap_size + 1):
-            if not self._compare(self._heap[parent(i)], self._heap[i]):
+        for i in range(1, self.heap_size):
+            p = (i - 1) // self.arity
+            if not self._compare(self._items[p], self._items[i]):
                 raise AssertionError(
                     f"Heap property violated at index {i}: "
-                    f"parent {self._heap[parent(i)]}, child {self._heap[i]}"
+                    f"parent {self._items[p]}, child {self._items[i]}"
                 )
 
     def heapify(self, i: int) -> None:
-        l = left(i)
-        r = right(i)
-        selected = i
-
-        if l <= self.heap_size and not self._compare(self._heap[selected], self._heap[l]):
-            selected = l
-        if r <= self.heap_size and not self._compare(self._heap[selected], self._heap[r]):
-            selected = r
-
-        if selected != i:
-            self._heap[i], self._heap[selected] = self._heap[selected], self._heap[i]
-            self.heapify(selected)
+        # i empieza en 1, como en el heap 1-indexado original
+        heap_core.sift_down(self._items, self._keys, i - 1, None, self._is_max(), arity=self.arity)
 
     def build_heap(self) -> None:
-        for i in range(self.heap_size // 2, 0, -1):
-            self.heapify(i)
+        heap_core.heapify(self._items, self._keys, self._is_max(), arity=self.arity)
 
     def get_heap(self) -> List[T]:
-        return self._heap[1 : self.heap_size + 1]
+        return self._items[:]
 
     def push(self, item: T) -> None:
-        self.heap_size += 1
-        if len(self._heap) <= self.heap_size:
-            self._heap.append(item)
-        else:
-            self._heap[self.heap_size] = item
-        
-        i = self.heap_size
-        while i > 1 and not self._compare(self._heap[parent(i)], self._heap[i]):
-            self._heap[i], self._heap[parent(i)] = self._heap[parent(i)], self._heap[i]
-            i = parent(i)
+        heap_core.push(self._items, self._keys, item, self._key(item), self._is_max(), arity=self.arity)
 
     def pop(self) -> T:
-        if self.heap_size < 1:
-            raise IndexError("pop from empty heap")
-        
-        root = self._heap[1]
-        self._heap[1] = self._heap[self.heap_size]
-        self.heap_size -= 1
-        self.heapify(1)
-        return root
+        return heap_core.pop(self._items, self._keys, self._is_max(), arity=self.arity)
+
+    def pushpop(self, item: T) -> T:
+        return heap_core.pushpop(self._items, self._keys, item, self._key(item), self._is_max(), arity=self.arity)
+
+    def replace(self, item: T) -> T:
+        return heap_core.replace(self._items, self._keys, item, self._key(item), self._is_max(), arity=self.arity)
 
     def peek(self) -> T:
-        if self.heap_size < 1:
+        if not self._items:
             raise IndexError("peek from empty heap")
-        return self._heap[1]
+        return self._items[0]
 
     def size(self) -> int:
         return self.heap_size
 
     def is_empty(self) -> bool:
-        return self.heap_size == 0
+        return not self._items
 
     @staticmethod
-    def heapsort(A: List[T], key: Callable[[T], any] = lambda x: x, reverse: bool = False) -> None:
-        heap_type = HeapType.MIN if reverse else HeapType.MAX
-        heap = Heap(A, heap_type, key)
-        
-        for i in range(len(A), 0, -1):
-            A[i-1] = heap.pop()
\ No newline at end of file
+    def heapsort(A: List[T], key: Callable[[T], any] = identity, reverse: bool = False, cache_keys: bool = True) -> None:
+        # No es estable; con key y cache_keys=True si lo es, porque el indice desempata
+        if cache_keys and key is not identity:
+            cached_sort(A, Heap.heapsort, key, reverse)
+            return
+        key = sort_key(key)
+        heap_core.heap_sort(A, key, reverse)
@@ -1,64 +1,73 @@
 from enum import Enum
+from operator import itemgetter
 from typing import List, Tuple, Callable
+import heap_core
 
 class HeapType(Enum):
     MAX = 1
     MIN = 2
 
+# Las entradas son (id, ...): el id es la llave del indice de posiciones
+entry_id = itemgetter(0)
+
 class PriorityQueue:
     def __init__(self, A: List[Tuple[str, int]], queueType: HeapType, key: Callable):
         self.A = A[:]
         self.queueType = queueType
         self.key = key
+        self.index = {}
         self.build_heap()
-    
-    def parent(self, i):
-        return (i - 1) // 2
-    
-    def left(self, i):
-        return 2 * i + 1
-    
-    def right(self, i):
-        return 2 * i + 2
-    
-    def compare(self, a, b):
-        return self.key(a) > self.key(b) if self.queueType == HeapType.MAX else self.key(a) < self.key(b)
-    
+
+    def __len__(self):
+        return len(self.A)
+
+    def _is_max(self):
+        return self.queueType == HeapType.MAX
+
     def heapify(self, i):
-        l, r = self.left(i), self.right(i)
-        extreme = i
-        if l < len(self.A) and self.compare(self.A[l], self.A[extreme]):
-            extreme = l
-        if r < len(self.A) and self.compare(self.A[r], self.A[extreme]):
-            extreme = r
-        if extreme != i:
-            self.A[i], self.A[extreme] = self.A[extreme], self.A[i]
-            self.heapify(extreme)
-    
+        heap_core.sift_down(self.A, self._keys, i, None, self._is_max(), self.index, entry_id)
+
+    def sift_up(self, i):
+        heap_core.sift_up(self.A, self._keys, i, self._is_max(), self.index, entry_id)
+
     def build_heap(self):
-        for i in range(len(self.A) // 2, -1, -1):
-            self.heapify(i)
-    
+        # Las prioridades se calculan una vez y viajan junto a cada entrada
+        self._keys = [self.key(e) for e in self.A]
+        heap_core.heapify(self.A, self._keys, self._is_max(), self.index, entry_id)
+
     def extremum(self):
         return self.A[0] if self.A else None
-    
+
     def extract_extremum(self):
         if not self.A:
             return None
-        extreme = self.A[0]
-        self.A[0] = self.A[-1]
-        self.A.pop()
-        self.heapify(0)
-        return extreme
-    
+        return self.remove(self.A[0][0])
+
+    def contains(self, id):
+        return id in self.index
+
+    def priority_of(self, id):
+        if id not in self.index:
+            return None
+        return self._keys[self.index[id]]
+
+    def remove(self, id):
+        if id not in self.index:
+            return None
+        return heap_core.remove(self.A, self._keys, self.index[id], self._is_max(), self.index, entry_id)
+
     def upsert(self, e):
-        for i in range(len(self.A)):
-            if self.A[i][0] == e[0]:
-                self.A[i] = e
-                self.build_heap()
-                return
-        self.A.append(e)
-        self.build_heap()
+        if e[0] in self.index:
+            i = self.index[e[0]]
+            self.A[i] = e
+            self._keys[i] = self.key(e)
+            self.update(i)
+        else:
+            heap_core.push(self.A, self._keys, e, self.key(e), self._is_max(), self.index, entry_id)
+
+    def update(self, i):
+        # Solo se mueve el elemento en i, hacia arriba o hacia abajo
+        heap_core.update(self.A, self._keys, i, self._is_max(), self.index, entry_id)
 
 if __name__ == "__main__":
     A = [
@@ -82,3 +91,6 @@ if __name__ == "__main__":
     print(pq.A)
     pq.upsert(("@", 12))
     print(pq.A)
+    print(pq.contains("@"), pq.priority_of("@"))  # True 12
+    print(pq.remove("@"))  # ('@', 12)
+    print(pq.contains("@"), pq.priority_of("@"))  # False None
@@ -1,42 +1,206 @@
 from typing import TypeVar, Callable
+from bisect import bisect_left, bisect_right
+from sort_keys import identity, cached_sort, descending, sort_key
 
 T = TypeVar("T")
 
-def merge_sort(A: list[T], key: Callable = lambda x: x, reverse: bool = False) -> None:
-    def merge(A, p, q, r):
-        L = A[p:q + 1]
-        R = A[q + 1:r + 1]
-        i = j = 0
-        k = p
-        while i < len(L) and j < len(R):
-            if key(L[i]) <= key(R[j]):
-                A[k] = L[i]
-                i += 1
+MIN_RUN = 32
+MIN_GALLOP = 7
+
+def merge_sort(A: list[T], key: Callable = identity, reverse: bool = False, cache_keys: bool = True) -> None:
+    # Estable en ambos sentidos. Con reverse se comparan las llaves invertidas
+    # (negadas en cached_sort o envueltas en Descending), nunca se invierte la lista
+    if cache_keys and (key is not identity or reverse):
+        cached_sort(A, merge_sort, key, reverse)
+        return
+    key = sort_key(key)
+    if reverse:
+        key = descending(key)
+
+    n = len(A)
+    runs = find_runs(A, key)
+    # El menor de dos runs vecinos nunca pasa de n/2 elementos
+    buffer = [None] * (n // 2)
+
+    # Bottom-up: se mezclan los runs por parejas hasta que queda uno
+    while len(runs) > 1:
+        merged = []
+        for i in range(0, len(runs) - 1, 2):
+            (p, q), (_, r) = runs[i], runs[i + 1]
+            merge(A, p, q, r, key, buffer)
+            merged.append((p, r))
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+
+def find_runs(A: list[T], key: Callable) -> list[tuple[int, int]]:
+    # Runs naturales [p, r): ascendentes, o estrictamente descendentes que se invierten
+    # (estrictos para no romper la estabilidad); los cortos se extienden a MIN_RUN
+    n = len(A)
+    runs = []
+    p = 0
+    while p < n:
+        r = p + 1
+        if r < n:
+            prev = key(A[r])
+            if prev < key(A[p]):
+                while r + 1 < n:
+                    k = key(A[r + 1])
+                    if not k < prev:
+                        break
+                    prev = k
+                    r += 1
+                A[p:r + 1] = A[p:r + 1][::-1]
             else:
-                A[k] = R[j]
-                j += 1
+                while r + 1 < n:
+                    k = key(A[r + 1])
+                    if k < prev:
+                        break
+                    prev = k
+                    r += 1
+            r += 1
+        end = min(n, p + MIN_RUN)
+        if r < end:
+            binary_insertion_sort(A, p, r, end, key)
+            r = end
+        runs.append((p, r))
+        p = r
+    return runs
+
+def binary_insertion_sort(A: list[T], p: int, start: int, r: int, key: Callable) -> None:
+    # A[p:start] ya esta ordenado
+    for i in range(start, r):
+        current = A[i]
+        j = bisect_right(A, key(current), p, i, key=key)
+        A[j + 1:i + 1] = A[j:i]
+        A[j] = current
+
+def merge(A: list[T], p: int, q: int, r: int, key: Callable, buffer: list) -> None:
+    # Si los dos runs ya estan en orden no hay nada que mezclar
+    if not key(A[q]) < key(A[q - 1]):
+        return
+    # Galope inicial: los extremos que ya estan en su lugar no se mueven
+    p = bisect_right(A, key(A[q]), p, q, key=key)
+    r = bisect_left(A, key(A[q - 1]), q, r, key=key)
+    if q - p <= r - q:
+        merge_lo(A, p, q, r, key, buffer)
+    else:
+        merge_hi(A, p, q, r, key, buffer)
+
+def merge_lo(A: list[T], p: int, q: int, r: int, key: Callable, buffer: list) -> None:
+    # Se copia el run izquierdo al buffer y se mezcla de izquierda a derecha
+    m = q - p
+    for t in range(m):
+        buffer[t] = A[p + t]
+    i, j, k = 0, q, p
+    left_wins = right_wins = 0
+    ki, kj = key(buffer[0]), key(A[q])
+
+    while True:
+        if kj < ki:
+            A[k] = A[j]
+            j += 1
             k += 1
-        while i < len(L):
-            A[k] = L[i]
+            if j == r:
+                break
+            kj = key(A[j])
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                # Galope: se copia de golpe todo lo del run derecho menor que buffer[i]
+                end = bisect_left(A, ki, j, r, key=key)
+                while j < end:
+                    A[k] = A[j]
+                    j += 1
+                    k += 1
+                if j == r:
+                    break
+                kj = key(A[j])
+                right_wins = 0
+        else:
+            A[k] = buffer[i]
             i += 1
             k += 1
-        while j < len(R):
-            A[k] = R[j]
-            j += 1
-            k += 1
+            if i == m:
+                break
+            ki = key(buffer[i])
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP:
+                end = bisect_right(buffer, kj, i, m, key=key)
+                while i < end:
+                    A[k] = buffer[i]
+                    i += 1
+                    k += 1
+                if i == m:
+                    break
+                ki = key(buffer[i])
+                left_wins = 0
 
-    def merge_sort_rec(A, p, r):
-        if p < r:
-            q = (p + r) // 2
-            merge_sort_rec(A, p, q)
-            merge_sort_rec(A, q + 1, r)
-            merge(A, p, q, r)
+    # Lo que quede del buffer va al final; lo que quede del run derecho ya esta en su lugar
+    while i < m:
+        A[k] = buffer[i]
+        i += 1
+        k += 1
 
-    merge_sort_rec(A, 0, len(A) - 1)
-    if reverse:
-        A.reverse()
+def merge_hi(A: list[T], p: int, q: int, r: int, key: Callable, buffer: list) -> None:
+    # Se copia el run derecho al buffer y se mezcla de derecha a izquierda
+    m = r - q
+    for t in range(m):
+        buffer[t] = A[q + t]
+    i, j, k = m - 1, q - 1, r - 1
+    left_wins = right_wins = 0
+    ki, kj = key(buffer[i]), key(A[j])
+
+    while True:
+        if ki < kj:
+            A[k] = A[j]
+            j -= 1
+            k -= 1
+            if j < p:
+                break
+            kj = key(A[j])
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP:
+                # Galope: todo lo del run izquierdo mayor que buffer[i] se mueve de golpe
+                start = bisect_right(A, ki, p, j + 1, key=key)
+                while j >= start:
+                    A[k] = A[j]
+                    j -= 1
+                    k -= 1
+                if j < p:
+                    break
+                kj = key(A[j])
+                left_wins = 0
+        else:
+            A[k] = buffer[i]
+            i -= 1
+            k -= 1
+            if i < 0:
+                break
+            ki = key(buffer[i])
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                start = bisect_left(buffer, kj, 0, i + 1, key=key)
+                while i >= start:
+                    A[k] = buffer[i]
+                    i -= 1
+                    k -= 1
+                if i < 0:
+                    break
+                ki = key(buffer[i])
+                right_wins = 0
+
+    while i >= 0:
+        A[k] = buffer[i]
+        i -= 1
+        k -= 1
 
 if __name__ == "__main__":
+    from sort_keys import SortOrder
+
     A = [3, 2, 5, 1, 9, 0, 8, 6, 7, 4]
     merge_sort(A)
     print(A)  # [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
@@ -48,3 +212,8 @@ if __name__ == "__main__":
     print(B)  # [(0, 2), (1, 6), (2, 0), (3, 8), (4, 7), (5, 5), (6, 4), (7, 9), (8, 1), (9, 3)]
     merge_sort(B, key=lambda x: x[1])
     print(B)  # [(2, 0), (8, 1), (0, 2), (9, 3), (6, 4), (5, 5), (1, 6), (4, 7), (3, 8), (7, 9)]
+
+    # Varias llaves en una pasada: primero por fecha ascendente, luego por region descendente
+    C = [("2024-03", "norte"), ("2024-01", "sur"), ("2024-03", "sur"), ("2024-01", "norte")]
+    merge_sort(C, key=[(lambda x: x[0], SortOrder.ASC), (lambda x: x[1], SortOrder.DESC)])
+    print(C)  # [('2024-01', 'sur'), ('2024-01', 'norte'), ('2024-03', 'sur'), ('2024-03', 'norte')]
@@ -1,4 +1,6 @@
 from typing import TypeVar, Callable
+from sort_keys import identity, cached_sort, descending, sort_key
+from L08 import Heap, HeapType
 
 T = TypeVar("T")
 
@@ -12,31 +14,209 @@ def partition(A: list[T], p: int, r: int, key: Callable) -> int:
     A[i + 1], A[r] = A[r], A[i + 1]
     return i + 1
 
-def quick_sort(A: list[T], key: Callable = lambda x: x, reverse: bool = False) -> None:
+INSERTION_CUTOFF = 16
+NINTHER_CUTOFF = 128
+
+def quick_sort(A: list[T], key: Callable = identity, reverse: bool = False, introsort: bool = True, cache_keys: bool = True) -> None:
+    # No es estable; con key o reverse (y cache_keys=True) si lo es, porque el indice desempata
+    if cache_keys and (key is not identity or reverse):
+        cached_sort(A, quick_sort, key, reverse, introsort=introsort)
+        return
+    key = sort_key(key)
+    if reverse:
+        key = descending(key)
+
     def quicksort_rec(A, p, r):
         if p < r:
             q = partition(A, p, r, key)
             quicksort_rec(A, p, q - 1)
             quicksort_rec(A, q + 1, r)
     
-    quicksort_rec(A, 0, len(A) - 1)
-    if reverse:
-        A.reverse()
-
-def select(A: list[T], i: int, key: Callable = lambda x: x) -> T:
-    def select_rec(A, p, r, i):
-        if p == r:
-            return A[p]
-        q = partition(A, p, r, key)
-        k = q - p + 1
-        if i == k:
-            return A[q]
-        elif i < k:
-            return select_rec(A, p, q - 1, i)
+    if introsort:
+        n = len(A)
+        introsort_rec(A, 0, n - 1, key, 2 * n.bit_length())
+    else:
+        quicksort_rec(A, 0, len(A) - 1)
+
+def introsort_rec(A: list[T], p: int, r: int, key: Callable, depth: int) -> None:
+    while r - p + 1 > INSERTION_CUTOFF:
+        # Si la recursion es demasiado profunda se cambia a heapsort: O(n log n) garantizado
+        if depth == 0:
+            heap_sort_range(A, p, r, key)
+            return
+        depth -= 1
+        lt, gt = partition3(A, p, r, key(choose_pivot(A, p, r, key)), key)
+        # Se recurre solo sobre el lado chico y se itera sobre el grande
+        if lt - p < r - gt:
+            introsort_rec(A, p, lt - 1, key, depth)
+            p = gt + 1
         else:
-            return select_rec(A, q + 1, r, i - k)
-    
-    return select_rec(A, 0, len(A) - 1, i)
+            introsort_rec(A, gt + 1, r, key, depth)
+            r = lt - 1
+    insertion_sort_range(A, p, r, key)
+
+def median_of_three(A: list[T], i: int, j: int, k: int, key: Callable) -> int:
+    a, b, c = key(A[i]), key(A[j]), key(A[k])
+    if a < b:
+        return j if b < c else (k if a < c else i)
+    return i if a < c else (k if b < c else j)
+
+def choose_pivot(A: list[T], p: int, r: int, key: Callable) -> T:
+    q = (p + r) // 2
+    if r - p + 1 < NINTHER_CUTOFF:
+        return A[median_of_three(A, p, q, r, key)]
+    # Ninther de Tukey: mediana de tres medianas de tres
+    s = (r - p) // 8
+    return A[median_of_three(
+        A,
+        median_of_three(A, p, p + s, p + 2 * s, key),
+        median_of_three(A, q - s, q, q + s, key),
+        median_of_three(A, r - 2 * s, r - s, r, key),
+        key,
+    )]
+
+def partition3(A: list[T], p: int, r: int, pivot, key: Callable) -> tuple[int, int]:
+    # Particion de tres vias: A[p:lt] < pivote, A[lt:gt + 1] == pivote, A[gt + 1:r + 1] > pivote
+    lt, i, gt = p, p, r
+    while i <= gt:
+        k = key(A[i])
+        if k < pivot:
+            A[lt], A[i] = A[i], A[lt]
+            lt += 1
+            i += 1
+        elif pivot < k:
+            A[i], A[gt] = A[gt], A[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def insertion_sort_range(A: list[T], p: int, r: int, key: Callable) -> None:
+    for i in range(p + 1, r + 1):
+        current = A[i]
+        current_key = key(current)
+        j = i - 1
+        while j >= p and current_key < key(A[j]):
+            A[j + 1] = A[j]
+            j -= 1
+        A[j + 1] = current
+
+def heap_sort_range(A: list[T], p: int, r: int, key: Callable) -> None:
+    def sift_down(i, n):
+        item = A[p + i]
+        item_key = key(item)
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and key(A[p + c]) < key(A[p + c + 1]):
+                c += 1
+            if not item_key < key(A[p + c]):
+                break
+            A[p + i] = A[p + c]
+            i = c
+        A[p + i] = item
+
+    n = r - p + 1
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(i, n)
+    for end in range(n - 1, 0, -1):
+        A[p], A[p + end] = A[p + end], A[p]
+        sift_down(0, end)
+
+def median_of_medians(A: list[T], p: int, r: int, key: Callable) -> T:
+    # Mediana de las medianas de grupos de 5 (BFPRT); las medianas se juntan al inicio del rango
+    m = 0
+    for g in range(p, r + 1, 5):
+        end = min(g + 4, r)
+        insertion_sort_range(A, g, end, key)
+        mid = (g + end) // 2
+        A[p + m], A[mid] = A[mid], A[p + m]
+        m += 1
+    # depth=0 obliga a que la seleccion entre las medianas tambien use median_of_medians
+    introselect(A, p, p + m - 1, p + m // 2, key, 0)
+    return A[p + m // 2]
+
+def introselect(A: list[T], p: int, r: int, i: int, key: Callable, depth: int) -> None:
+    # Quickselect iterativo: deja en A[i] el elemento que tendria ordenado el rango A[p..r]
+    while r - p + 1 > INSERTION_CUTOFF:
+        # Si el pivote falla muchas veces se cambia a median_of_medians: O(n) garantizado
+        if depth == 0:
+            pivot = median_of_medians(A, p, r, key)
+        else:
+            depth -= 1
+            pivot = choose_pivot(A, p, r, key)
+        lt, gt = partition3(A, p, r, key(pivot), key)
+        if i < lt:
+            r = lt - 1
+        elif i > gt:
+            p = gt + 1
+        else:
+            return
+    insertion_sort_range(A, p, r, key)
+
+def nth_element(A: list[T], n: int, key: Callable = identity, reverse: bool = False, cache_keys: bool = True) -> T:
+    # Reacomoda A: A[n] queda como en la lista ordenada, antes de el nada es mayor y despues nada es menor
+    if not 0 <= n < len(A):
+        raise IndexError("nth_element index out of range")
+    if cache_keys and (key is not identity or reverse):
+        cached_sort(A, nth_element, key, reverse, n=n)
+        return A[n]
+    key = sort_key(key)
+    if reverse:
+        key = descending(key)
+
+    size = len(A)
+    introselect(A, 0, size - 1, n, key, 2 * size.bit_length())
+    return A[n]
+
+def partial_sort(A: list[T], k: int, key: Callable = identity, reverse: bool = False, cache_keys: bool = True) -> None:
+    # Solo A[:k] queda ordenado (los k menores, o mayores con reverse); el resto en cualquier orden
+    k = min(k, len(A))
+    if k <= 0:
+        return
+    if cache_keys and (key is not identity or reverse):
+        cached_sort(A, partial_sort, key, reverse, k=k)
+        return
+    key = sort_key(key)
+    if reverse:
+        key = descending(key)
+
+    introselect(A, 0, len(A) - 1, k - 1, key, 2 * len(A).bit_length())
+    introsort_rec(A, 0, k - 1, key, 2 * k.bit_length())
+
+def top_k(iterable, k: int, key: Callable = identity, reverse: bool = True) -> list[T]:
+    # Igual a sorted(iterable, key=key, reverse=reverse)[:k], con un heap de k elementos: O(n log k)
+    if k <= 0:
+        return []
+    # La raiz es el peor de los k guardados; el indice desempata a favor del que llego antes
+    if reverse:
+        heap = Heap([], HeapType.MIN)
+        for i, x in enumerate(iterable):
+            entry = (key(x), -i, x)
+            if heap.size() < k:
+                heap.push(entry)
+            elif entry[:2] > heap.peek()[:2]:
+                heap.pop()
+                heap.push(entry)
+    else:
+        heap = Heap([], HeapType.MAX)
+        for i, x in enumerate(iterable):
+            entry = (key(x), i, x)
+            if heap.size() < k:
+                heap.push(entry)
+            elif entry[:2] < heap.peek()[:2]:
+                heap.pop()
+                heap.push(entry)
+
+    # Se extraen del peor al mejor
+    result = [heap.pop()[2] for _ in range(heap.size())]
+    result.reverse()
+    return result
+
+def select(A: list[T], i: int, key: Callable = identity) -> T:
+    # i-esimo menor (desde 1); trabaja sobre una copia, A no se modifica
+    return nth_element(list(A), i - 1, key)
 
 if __name__ == "__main__":
     A = [3, 2, 5, 1, 9, 0, 8, 6, 7, 4]
@@ -51,4 +231,12 @@ if __name__ == "__main__":
     quick_sort(B, key=lambda x: x[1])
     print(B)  # [(2, 0), (8, 1), (0, 2), (9, 3), (6, 4), (5, 5), (1, 6), (4, 7), (3, 8), (7, 9)]
     print(select(B, 4))  # (3, 8)
-    print(select(B, 4, key=lambda x: x[1]))  # (9, 3)
\ No newline at end of file
+    print(select(B, 4, key=lambda x: x[1]))  # (9, 3)
+    print(B[4])  # (6, 4)
+
+    C = [5, 1, 9, 3, 7, 2, 8]
+    partial_sort(C, 3)
+    print(C[:3])  # [1, 2, 3]
+    print(nth_element(C, 0, reverse=True))  # 9
+    print(top_k(iter(range(1_000_000)), 3))  # [999999, 999998, 999997]
+    print(top_k(B, 2, key=lambda x: x[1], reverse=False))  # [(2, 0), (8, 1)]
@@ -1,7 +1,9 @@
 from enum import Enum
 from functools import total_ordering
+from typing import Iterator
 from typing_extensions import Self
 from collections import deque
+from csr_graph import CSRGraph, BFSResult, DFSResult
 
 class NodeColor(Enum):
     WHITE = 0
@@ -36,12 +38,19 @@ class GraphType(Enum):
     UNDIRECTED = 0
     DIRECTED = 1
 
+class CycleError(TypeError):
+    def __init__(self, cycle: list[str]):
+        # El ciclo empieza y termina en el mismo nodo, e.g. ['c', 'd', 'c']
+        super().__init__(f"Topological sort is not defined for cyclic graphs: {cycle}")
+        self.cycle = cycle
+
 class Graph:
     def __init__(self, type_: GraphType):
         self.type = type_
         self.V: dict[str, Node] = dict()
         self.E: set[tuple[Node, Node]] = set()
         self.Adj: dict[Node, set[Node]] = dict()
+        self._csr: CSRGraph = None
 
     def __repr__(self):
         return str(self.Adj)
@@ -55,6 +64,7 @@ class Graph:
             v_node = Node(v)
             self.V[v] = v_node
             self.Adj[v_node] = set()
+            self._csr = None
 
     def add_edge(self, u: str, v: str):
         u = self.get_node(u)
@@ -64,6 +74,7 @@ class Graph:
             self.Adj[u].add(v)
             if self.type == GraphType.UNDIRECTED:
                 self.Adj[v].add(u)
+            self._csr = None
         else:
             raise ValueError("Node not found in graph")
 
@@ -75,6 +86,26 @@ class Graph:
         for e in e_list:
             self.add_edge(*e)
 
+    def freeze(self) -> CSRGraph:
+        return CSRGraph.from_edges(
+            self.V.keys(),
+            ((u.value, v.value) for u, v in self.E),
+            directed=self.type == GraphType.DIRECTED,
+        )
+
+    def frozen(self) -> CSRGraph:
+        # Se reutiliza la version CSR mientras el grafo no cambie
+        if self._csr is None:
+            self._csr = self.freeze()
+        return self._csr
+
+    # BFS sin modificar los nodos: el estado vive en arreglos por consulta
+    def bfs_result(self, s: str) -> BFSResult:
+        return self.frozen().bfs(s)
+
+    def dfs_result(self) -> DFSResult:
+        return self.frozen().dfs()
+
     def __reset_nodes(self):
         for v in self.V.values():
             v.color = NodeColor.WHITE
@@ -151,7 +182,7 @@ class Graph:
         return path
 
     # Depth First Search (DFS)
-    def dfs(self):
+    def dfs(self, finish_order: list[Node] = None):
         self.__reset_nodes()
         time = 0
 
@@ -159,9 +190,9 @@ class Graph:
             # Si aun no se visita un nodo...
             if u.color == NodeColor.WHITE:
                 # Orden de nodos en dfs
-               time = self.__dfs_visit(u, time)
+               time = self.__dfs_visit(u, time, finish_order=finish_order)
 
-    def __dfs_visit(self, u: Node, time: int, component=None):
+    def __dfs_visit(self, u: Node, time: int, component=None, finish_order=None):
         time += 1
         # Tiempo de descubrimiento de u
         u.discovered = time
@@ -171,17 +202,32 @@ class Graph:
             # Se agrega el nodo actual a la lista component
             component.append(u)
 
-        for v in self.Adj[u]:
-            if v.color == NodeColor.WHITE:
-                # Se define u como padre de v
-                v.parent = u
-                time = self.__dfs_visit(v, time, component)
-        # Se colorean de negro los nodos ya visitados
-        u.color = NodeColor.BLACK
-
-        # Se determina el tiempo del proceso
-        time += 1
-        u.finished = time
+        # Pila explicita de (nodo, iterador de vecinos) en lugar de recursion,
+        # asi se visitan los vecinos en el mismo orden que la version recursiva
+        stack = [(u, iter(self.Adj[u]))]
+        while stack:
+            u, neighbors = stack[-1]
+            for v in neighbors:
+                if v.color == NodeColor.WHITE:
+                    # Se define u como padre de v
+                    v.parent = u
+                    time += 1
+                    v.discovered = time
+                    v.color = NodeColor.GRAY
+                    if component is not None:
+                        component.append(v)
+                    stack.append((v, iter(self.Adj[v])))
+                    break
+            else:
+                stack.pop()
+                # Se colorean de negro los nodos ya visitados
+                u.color = NodeColor.BLACK
+
+                # Se determina el tiempo del proceso
+                time += 1
+                u.finished = time
+                if finish_order is not None:
+                    finish_order.append(u)
         return time
 
     # Tiene que ver con los tiempos de inicio y de fin
@@ -206,63 +252,117 @@ class Graph:
     def topological_sort(self) -> list[str]:
         # Comprueba que el grafo sea directo
         assert self.type == GraphType.DIRECTED, "Topological sort is not defined for undirected graphs"
-        self.dfs()
+        finish_order = []
+        self.dfs(finish_order)
 
-        classified_edges = self.__classify_edges()
-        # Si el grafo tiene una arista trasera, no se ejecuta
-        if classified_edges["back"]:
-            raise TypeError("Topological sort is not defined...")
+        # Una arista (u, v) es trasera si v termina despues que u
+        for u, v in self.E:
+            if v.finished >= u.finished:
+                cycle = [v.value]
+                while u != v:
+                    cycle.append(u.value)
+                    u = u.parent
+                cycle.append(v.value)
+                cycle.reverse()
+                raise CycleError(cycle)
+
+        # Devuelve los nodos en orden decreciente de finalizacion
+        return [node.value for node in reversed(finish_order)]
+
+    # Algoritmo de Kahn: entrega los nodos conforme quedan sin predecesores
+    def topological_order(self) -> Iterator[str]:
+        assert self.type == GraphType.DIRECTED, "Topological sort is not defined for undirected graphs"
+        in_degree = {u: 0 for u in self.V.values()}
+        for u in self.V.values():
+            for v in self.Adj[u]:
+                in_degree[v] += 1
 
-        # Devuelve los nodos de mayor a menor
-        sorted_nodes = sorted(self.V.values(), key=lambda  node: node.finished, reverse=True)
-        return [node.value for node in sorted_nodes]
+        q = deque(u for u, d in in_degree.items() if d == 0)
+        while q:
+            u = q.popleft()
+            del in_degree[u]
+            yield u.value
+            for v in self.Adj[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    q.append(v)
+
+        # Los nodos restantes tienen un predecesor que tambien quedo pendiente
+        if in_degree:
+            raise CycleError(self.__find_cycle(in_degree.keys()))
+
+    def __find_cycle(self, remaining) -> list[str]:
+        pred = {}
+        for u in remaining:
+            for v in self.Adj[u]:
+                if v in remaining and v not in pred:
+                    pred[v] = u
+
+        # Se camina hacia atras hasta repetir un nodo
+        u = next(iter(remaining))
+        seen = set()
+        while u not in seen:
+            seen.add(u)
+            u = pred[u]
+        cycle = [u.value]
+        v = pred[u]
+        while v != u:
+            cycle.append(v.value)
+            v = pred[v]
+        cycle.append(u.value)
+        cycle.reverse()
+        return cycle
 
     # Funcion que se usa solo con scc
-    def __dfs_visit_scc(self, u: Node, component: list[Node]):
-        # Marca el nodo en gris
-        u.color = NodeColor.GRAY
+    def __dfs_visit_scc(self, u: Node, Adj: dict[Node, set[Node]], visited: set[Node], component: list[Node]):
+        # Marca el nodo como visitado
+        visited.add(u)
         # Agrega el nodo a component
         component.append(u)
-
-        for v in self.Adj[u]:
-            # Si el nodo no ha sido descubierto...
-            if v.color == NodeColor.WHITE:
-                self.__dfs_visit_scc(v, component)
-        u.color = NodeColor.BLACK
+        stack = [iter(Adj[u])]
+
+        while stack:
+            for v in stack[-1]:
+                # Si el nodo no ha sido descubierto...
+                if v not in visited:
+                    visited.add(v)
+                    component.append(v)
+                    stack.append(iter(Adj[v]))
+                    break
+            else:
+                stack.pop()
 
     # Strongly Connected Components (SCC)
     def scc(self) -> list[list[str]]:
         # Aseguramos que el grafo sea dirigido
         assert (self.type == GraphType.DIRECTED), "SCC not supported or undirected graph"
 
-        # 1. Llamar a DFS
-        self.dfs()
-        # 2. Construir el grafo transpuesto
-        G_T = Graph(self.type)
-        # Agregar los nodos al nuevo grafo
-        G_T.add_nodes(self.V.keys())
+        # 1. Llamar a DFS guardando el orden en que terminan los nodos
+        finish_order = []
+        self.dfs(finish_order)
+        # 2. Construir la adyacencia transpuesta (sin crear otro Graph)
+        Adj_T = {u: set() for u in self.V.values()}
 
-        # Agregar las aristas al grafo en sentido contrario
+        # Agregar las aristas en sentido contrario
         for u in self.V.values():
             for v in self.Adj[u]:
-                G_T.add_edge(v.value, u.value)
+                Adj_T[v].add(u)
 
-        # Ordena los nodos
-        sorted_nodes = sorted(self.V.values(), key=lambda u: u.finished, reverse=True)
-        G_T.__reset_nodes()
+        visited = set()
         sccs = []
 
-        # 3. Modificar DFS en orden decreciente sobre el grafo transpuesto
-        for u in sorted_nodes:
-            u_T = G_T.get_node(u.value)
-            if u_T.color == NodeColor.WHITE:
+        # 3. DFS en orden decreciente de finalizacion sobre la transpuesta
+        for u in reversed(finish_order):
+            if u not in visited:
                 component = []
-                G_T.__dfs_visit_scc(u_T, component)
+                self.__dfs_visit_scc(u, Adj_T, visited, component)
                 sccs.append([v.value for v in component])
 
         return sccs
 
 if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
     G = Graph(GraphType.DIRECTED)
     G.add_nodes(list("abcdefgh"))
     G.add_edges(
@@ -316,10 +416,38 @@ if __name__ == "__main__":
     try:
         print(G.topological_sort())
         # TypeError: Topological sort is not defined for cyclic graphs.
-    except:
-        pass
+    except CycleError as e:
+        print(e.cycle)
+        # Por ejemplo: ['f', 'g', 'f']
+    D = Graph(GraphType.DIRECTED)
+    D.add_nodes(["calzones", "calcetines", "pantalon", "zapatos", "cinturon"])
+    D.add_edges(
+        [
+            ("calzones", "pantalon"),
+            ("calzones", "zapatos"),
+            ("calcetines", "zapatos"),
+            ("pantalon", "zapatos"),
+            ("pantalon", "cinturon"),
+        ]
+    )
+    for v in D.topological_order():
+        print(v, end=" ")
+    print()
+    # calzones calcetines pantalon zapatos cinturon  (el orden entre zapatos y cinturon puede variar)
     print(G._Graph__classify_edges())
     # Al correr el codigo a veces da forward = [] y a veces da forward = [(b, f)]
     # {'tree': [(a, b), (b, f), (b, c), (b, e), (c, d), (f, g), (g, h)], 'back': [(d, c), (e, a), (g, f), (h, h)], 'forward': [], 'cross': [(c, g), (d, h), (e, f)]}
     print(G.scc())
-    # [['b', 'e', 'a'], ['d', 'c'], ['g', 'f'], ['h']]
\ No newline at end of file
+    # [['b', 'e', 'a'], ['d', 'c'], ['g', 'f'], ['h']]
+    C = G.freeze()
+    print(C)
+    # CSRGraph(nodes=8, edges=14)
+    result = C.bfs("a")
+    print(result.distance_to("h"), len(result.path_to("h")))
+    # 4 5
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(G.bfs_result, "abcdefgh"))
+    print([r.distance_to("h") for r in results])
+    # [4, 3, 2, 1, 3, 2, 1, 0]
+    print(sorted(sorted(c) for c in C.scc()))
+    # [['a', 'b', 'e'], ['c', 'd'], ['f', 'g'], ['h']]
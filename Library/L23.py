@@ -24,27 +24,170 @@ class Node:
         return hash(self.value)
 
 
-class DisjointSets:
-    def __init__(self):
-        self.sets = []
+class UnionFind:
+    def __init__(self, elements=()):
+        self._index: dict = dict()
+        self._elements: list = []
+        self._parent: list[int] = []
+        self._rank: list[int] = []
+        self._count = 0
+        self.make_sets(elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __contains__(self, x) -> bool:
+        return x in self._index
+
+    def make_set(self, x) -> None:
+        if x in self._index:
+            return
+        i = len(self._elements)
+        self._index[x] = i
+        self._elements.append(x)
+        self._parent.append(i)
+        self._rank.append(0)
+        self._count += 1
+
+    def make_sets(self, elements) -> None:
+        index = self._index
+        parent = self._parent
+        start = i = len(self._elements)
+        for x in elements:
+            if x not in index:
+                index[x] = i
+                self._elements.append(x)
+                parent.append(i)
+                i += 1
+        self._rank.extend([0] * (i - start))
+        self._count += i - start
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        # Compresion de caminos por mitades (iterativa)
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
 
-    def make_set(self, x):
-        self.sets.append({x})
+    def find(self, x):
+        return self._elements[self._find(self._index[x])]
+
+    def union(self, x, y) -> bool:
+        i = self._find(self._index[x])
+        j = self._find(self._index[y])
+        if i == j:
+            return False
+        rank = self._rank
+        # Union por rango: el arbol mas bajo cuelga del mas alto
+        if rank[i] < rank[j]:
+            i, j = j, i
+        self._parent[j] = i
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        self._count -= 1
+        return True
+
+    def connected(self, x, y) -> bool:
+        return self._find(self._index[x]) == self._find(self._index[y])
+
+    def component_count(self) -> int:
+        return self._count
+
+
+class DisjointSets(UnionFind):
+    @property
+    def sets(self) -> list[set]:
+        groups = dict()
+        for i, x in enumerate(self._elements):
+            groups.setdefault(self._find(i), set()).add(x)
+        return list(groups.values())
 
     def find_set(self, x):
-        for s in self.sets:
-            if x in s:
-                return s
-        return None
+        # Regresa el conjunto completo de x, como antes; para el representante se usa find()
+        if x not in self._index:
+            return None
+        root = self._find(self._index[x])
+        return {y for i, y in enumerate(self._elements) if self._find(i) == root}
 
-    def union(self, x, y):
-        s_x = self.find_set(x)
-        s_y = self.find_set(y)
-        if s_x and s_y and s_x != s_y:
-            s_union = s_x.union(s_y)
-            self.sets.remove(s_x)
-            self.sets.remove(s_y)
-            self.sets.append(s_union)
+    def union(self, x, y) -> bool:
+        if x not in self._index or y not in self._index:
+            return False
+        return super().union(x, y)
+
+
+class IndexedMinHeap:
+    def __init__(self):
+        self._items: list = []
+        self._keys: list[float] = []
+        self._pos: dict = dict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._pos
+
+    def key_of(self, item) -> float:
+        return self._keys[self._pos[item]]
+
+    def push(self, item, key: float) -> None:
+        if item in self._pos:
+            raise ValueError("Item already in heap")
+        self._items.append(item)
+        self._keys.append(key)
+        self._sift_up(len(self._items) - 1, item, key)
+
+    def decrease_key(self, item, key: float) -> None:
+        i = self._pos[item]
+        if key > self._keys[i]:
+            raise ValueError("New key is greater than current key")
+        self._sift_up(i, item, key)
+
+    def extract_min(self) -> tuple:
+        if not self._items:
+            raise IndexError("extract from empty heap")
+        items, keys = self._items, self._keys
+        root, root_key = items[0], keys[0]
+        del self._pos[root]
+        last, last_key = items.pop(), keys.pop()
+        if items:
+            self._sift_down(0, last, last_key)
+        return root, root_key
+
+    def _sift_up(self, i: int, item, key: float) -> None:
+        items, keys, pos = self._items, self._keys, self._pos
+        # Se recorre el hueco hacia arriba en vez de intercambiar en cada paso
+        while i > 0:
+            p = (i - 1) // 2
+            if keys[p] <= key:
+                break
+            items[i] = items[p]
+            keys[i] = keys[p]
+            pos[items[i]] = i
+            i = p
+        items[i] = item
+        keys[i] = key
+        pos[item] = i
+
+    def _sift_down(self, i: int, item, key: float) -> None:
+        items, keys, pos = self._items, self._keys, self._pos
+        n = len(items)
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and keys[c + 1] < keys[c]:
+                c += 1
+            if keys[c] >= key:
+                break
+            items[i] = items[c]
+            keys[i] = keys[c]
+            pos[items[i]] = i
+            i = c
+        items[i] = item
+        keys[i] = key
+        pos[item] = i
 
 
 class GraphType(Enum):
@@ -100,15 +243,15 @@ class Graph:
 
     def kruskal(self) -> set[tuple[int, int, float]]:
         A = set()
-        ds = DisjointSets()
-        for node in self.V.values():
-            ds.make_set(node)
+        uf = UnionFind(self.V.values())
 
         sorted_edges = sorted(self.E.items(), key=lambda x: x[1])
         for (u, v), w in sorted_edges:
-            if ds.find_set(u) != ds.find_set(v):
+            # union() regresa False si u y v ya estaban en el mismo conjunto
+            if uf.union(u, v):
                 A.add((u.value, v.value, w))
-                ds.union(u, v)
+                if uf.component_count() == 1:
+                    break
         return A
 
     def prim(self, r: int) -> set[tuple[int, int, float]]:
@@ -118,21 +261,25 @@ class Graph:
 
         start = self.get_node(r)
         start.key = 0
-        Q = list(self.V.values())
-        heap = [(u.key, u) for u in Q]
-        visited = set()
+        Q = IndexedMinHeap()
+        for u in self.V.values():
+            Q.push(u, u.key)
         A = set()
 
-        while heap:
-            heap.sort()
-            _, u = heap.pop(0)
-            visited.add(u)
+        E = self.E
+        while Q:
+            u, _ = Q.extract_min()
             for v in self.Adj[u]:
-                weight = self.w(u, v)
-                if v not in visited and weight < v.key:
+                # Solo se relajan los nodos que siguen en la cola
+                if v not in Q:
+                    continue
+                weight = E.get((u, v))
+                if weight is None:
+                    weight = E[(v, u)]
+                if weight < v.key:
                     v.key = weight
                     v.parent = u
-                    heap = [(x.key, x) for x in self.V.values() if x not in visited]
+                    Q.decrease_key(v, weight)
 
         for v in self.V.values():
             if v.parent:
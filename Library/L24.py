@@ -3,6 +3,7 @@ from enum import Enum
 from itertools import combinations
 from functools import total_ordering
 import heapq
+from csr_graph import CSRGraph, shortest_paths_many
 
 
 class NodeColor(Enum):
@@ -47,6 +48,7 @@ class Graph:
         self.V: dict[int, Node] = dict()
         self.E: dict[tuple[Node, Node], float] = dict()
         self.Adj: dict[Node, set[Node]] = dict()
+        self._csr: CSRGraph = None
 
     def __repr__(self):
         return str(self.Adj)
@@ -60,6 +62,7 @@ class Graph:
             v_node = Node(v)
             self.V[v] = v_node
             self.Adj[v_node] = set()
+            self._csr = None
 
     def add_edge(self, u: int, v: int, w: float):
         u = self.get_node(u)
@@ -69,6 +72,7 @@ class Graph:
             self.Adj[u].add(v)
             if self.type == GraphType.UNDIRECTED:
                 self.Adj[v].add(u)
+            self._csr = None
         else:
             raise ValueError("Node not found in graph")
 
@@ -80,6 +84,18 @@ class Graph:
         for e in e_list:
             self.add_edge(*e)
 
+    def freeze(self) -> CSRGraph:
+        return CSRGraph.from_edges(
+            self.V.keys(),
+            ((u.value, v.value, w) for (u, v), w in self.E.items()),
+            directed=self.type == GraphType.DIRECTED,
+        )
+
+    def frozen(self) -> CSRGraph:
+        if self._csr is None:
+            self._csr = self.freeze()
+        return self._csr
+
     def __reset_nodes(self):
         for v in self.V.values():
             v.color = NodeColor.WHITE
@@ -104,27 +120,48 @@ class Graph:
         s_node = self.get_node(s)
         s_node.d = 0
         for _ in range(len(self.V) - 1):
+            changed = False
             for (u, v), w in self.E.items():
-                self.__relax(u, v)
+                if v.d > u.d + w:
+                    v.d = u.d + w
+                    v.parent = u
+                    changed = True
+            # Sin cambios en una pasada ya no hay nada que relajar
+            if not changed:
+                return True
         for (u, v), w in self.E.items():
             if v.d > u.d + w:
                 return False
         return True
 
+    def negative_cycle(self, s: int, mode: str = "batch") -> list[int]:
+        _, _, cycle = self.frozen().bellman_ford(s, mode)
+        return cycle
+
     def dags(self, s: int):
         self.__reset_nodes()
         def dfs_visit(u, time, sorted_nodes):
             u.color = NodeColor.GRAY
             time += 1
             u.discovered = time
-            for v in self.Adj[u]:
-                if v.color == NodeColor.WHITE:
-                    v.parent = u
-                    time = dfs_visit(v, time, sorted_nodes)
-            u.color = NodeColor.BLACK
-            time += 1
-            u.finished = time
-            sorted_nodes.insert(0, u)
+            # Pila explicita para no depender del limite de recursion
+            stack = [(u, iter(self.Adj[u]))]
+            while stack:
+                u, neighbors = stack[-1]
+                for v in neighbors:
+                    if v.color == NodeColor.WHITE:
+                        v.parent = u
+                        v.color = NodeColor.GRAY
+                        time += 1
+                        v.discovered = time
+                        stack.append((v, iter(self.Adj[v])))
+                        break
+                else:
+                    stack.pop()
+                    u.color = NodeColor.BLACK
+                    time += 1
+                    u.finished = time
+                    sorted_nodes.append(u)
             return time
 
         sorted_nodes = []
@@ -132,7 +169,11 @@ class Graph:
         for u in self.V.values():
             if u.color == NodeColor.WHITE:
                 time = dfs_visit(u, time, sorted_nodes)
+        sorted_nodes.reverse()
 
+        # Los padres del DFS no son caminos desde s; solo cuentan los de la relajacion
+        for u in sorted_nodes:
+            u.parent = None
         s_node = self.get_node(s)
         s_node.d = 0
         for u in sorted_nodes:
@@ -158,16 +199,17 @@ class Graph:
         path = []
         current = self.get_node(v)
         while current and current.value != s:
-            path.insert(0, (current.value, current.d))
+            path.append((current.value, current.d))
             current = current.parent
         if current:
-            path.insert(0, (s, self.get_node(s).d))
+            path.append((s, self.get_node(s).d))
+        path.reverse()
         return path
 
     def bellman_ford_shortest_paths(self, s: int, v: int) -> list[tuple[int, float]]:
         if self.bellman_ford(s):
             return self.print_path(s, v)
-        raise ValueError("Negative weight cycle found in Graph.")
+        raise ValueError(f"Negative weight cycle found in Graph: {self.negative_cycle(s)}")
 
     def dags_shortest_paths(self, s: int, v: int) -> list[tuple[int, float]]:
         self.dags(s)
@@ -177,6 +219,25 @@ class Graph:
         self.dijkstra(s)
         return self.print_path(s, v)
 
+    def bidirectional_dijkstra_shortest_paths(self, s: int, v: int) -> list[tuple[int, float]]:
+        _, nodes = self.frozen().bidirectional_dijkstra(s, v)
+        if not nodes:
+            # Sin camino: igual que print_path, solo el destino con distancia infinita
+            return [(v, float("inf"))]
+        path = []
+        d = 0
+        for i, u in enumerate(nodes):
+            if i:
+                a, b = self.get_node(nodes[i - 1]), self.get_node(u)
+                d += self.E.get((a, b), self.E.get((b, a)))
+            path.append((u, d))
+        return path
+
+    def shortest_paths_many(
+        self, sources: list[int], targets: list[int], workers: int = None, chunk_size: int = 16
+    ) -> dict[tuple[int, int], tuple[float, list[int]]]:
+        return shortest_paths_many(self.frozen(), sources, targets, workers, chunk_size)
+
 
 if __name__ == "__main__":
     G = Graph(GraphType.DIRECTED)
@@ -191,4 +252,22 @@ if __name__ == "__main__":
         G.bellman_ford_shortest_paths(0, 18)
         == G.dijkstra_shortest_paths(0, 18)
         == G.dags_shortest_paths(0, 18)
-    )
\ No newline at end of file
+    )
+
+    C = G.freeze()
+    d, parent = C.dijkstra(0)
+    # En CSRGraph un destino inalcanzable da un camino vacio
+    expected = [v for v, _ in G.dijkstra_shortest_paths(0, 18)] if d[C.index[18]] < float("inf") else []
+    assert C.path(parent, 0, 18) == expected
+    assert G.bidirectional_dijkstra_shortest_paths(0, 18) == G.dijkstra_shortest_paths(0, 18)
+    # chunk_size=2 reparte las 5 fuentes en 3 tareas del pool
+    paths = G.shortest_paths_many(range(5), [18, 19], workers=2, chunk_size=2)
+    dist, path = paths[(3, 19)]
+    assert path == ([v for v, _ in G.dijkstra_shortest_paths(3, 19)] if dist < float("inf") else [])
+
+    G.add_edges([(18, 3, -5.0)])
+    try:
+        G.bellman_ford_shortest_paths(0, 18)
+    except ValueError as e:
+        print(e)
+        # Negative weight cycle found in Graph: [3, ..., 18, 3]
@@ -0,0 +1,449 @@
+import argparse
+import heapq
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from functools import partial
+
+from loader import load
+
+timeit = load("Library/L01 - timeit.py").timeit
+
+# inputs: "ints" recorre las distribuciones; "graph" usa un DAG aleatorio disperso
+Case = namedtuple("Case", ["name", "group", "inputs", "run", "max_n"])
+
+DISTRIBUTIONS = {
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n, 0, -1)),
+    "random": lambda n, rng: rng.sample(range(10 * n), n),
+    "few_unique": lambda n, rng: [rng.randrange(8) for _ in range(n)],
+}
+
+
+def _sort_cases() -> list[Case]:
+    L02 = load("Library/L02 - insertion.py")
+    L03 = load("Library/L03 - shell.py")
+    L04 = load("Library/L04 - selection.py")
+    L08 = load("Library/L08.py")
+    L10 = load("Library/L10.py")
+    L11 = load("Library/L11.py")
+    heapsort2 = load("Library/heapsort2.py")
+    E08 = load("Library/E08.1.py")
+    Sorts = load("Sorts.py")
+    Monticulos = load("Monticulos.py")
+    return [
+        Case("L02.insertion_sort", "sort", "ints", L02.insertion_sort, 2000),
+        *[Case(f"L03.shell_sort[{g}]", "sort", "ints", partial(L03.shell_sort, gaps=g), None) for g in L03.GAPS],
+        Case("L04.selection_sort", "sort", "ints", L04.selection_sort, 2000),
+        Case("L10.merge_sort", "sort", "ints", L10.merge_sort, None),
+        Case("L11.quick_sort", "sort", "ints", L11.quick_sort, None),
+        Case("L08.Heap.heapsort", "sort", "ints", L08.Heap.heapsort, None),
+        Case("heapsort2.heap_sort", "sort", "ints", heapsort2.heap_sort, None),
+        Case("E08.1.pgSort", "sort", "ints", E08.pgSort, None),
+        Case("Sorts.shell_sort", "sort", "ints", Sorts.shell_sort, None),
+        Case("Sorts.selection_sort", "sort", "ints", Sorts.selection_sort, 2000),
+        Case("Sorts.counting_sort", "sort", "ints", Sorts.counting_sort, None),
+        Case("Sorts.radix_sort", "sort", "ints", Sorts.radix_sort, None),
+        Case("Sorts.bucket_sort", "sort", "ints", Sorts.bucket_sort, None),
+        Case("Monticulos.ord_texto", "sort", "ints", Monticulos.ord_texto, None),
+        Case("builtin.sorted", "sort", "ints", sorted, None),
+    ]
+
+
+def _heap_cases() -> list[Case]:
+    L08 = load("Library/L08.py")
+    L09 = load("Library/L09.py")
+    heap_core = load("Library/heap_core.py")
+    pairing_heap = load("Library/pairing_heap.py")
+
+    def l08_push_pop(A):
+        h = L08.Heap([], L08.HeapType.MIN)
+        for x in A:
+            h.push(x)
+        while not h.is_empty():
+            h.pop()
+
+    def l09_upsert_extract(A):
+        pq = L09.PriorityQueue([], L09.HeapType.MIN, key=lambda e: e[1])
+        for i, x in enumerate(A):
+            pq.upsert((i, x))
+        for i, x in enumerate(A):
+            pq.upsert((i, -x))
+        while pq.extract_extremum() is not None:
+            pass
+
+    def heapq_push_pop(A):
+        h = []
+        for x in A:
+            heapq.heappush(h, x)
+        while h:
+            heapq.heappop(h)
+
+    def core_push_pop(A):
+        h = []
+        for x in A:
+            heap_core.push(h, h, x, x)
+        while h:
+            heap_core.pop(h, h)
+
+    def heapq_heapify(A):
+        heapq.heapify(A[:])
+
+    def core_heapify(A):
+        h = A[:]
+        heap_core.heapify(h, h)
+
+    def heapq_pushpop(A):
+        h = A[: len(A) // 2]
+        heapq.heapify(h)
+        for x in A:
+            heapq.heappushpop(h, x)
+
+    def core_pushpop(A):
+        h = A[: len(A) // 2]
+        heap_core.heapify(h, h)
+        for x in A:
+            heap_core.pushpop(h, h, x, x)
+
+    def runs(A):
+        return [sorted(A[i::8]) for i in range(8)]
+
+    def heapq_merge(A):
+        for _ in heapq.merge(*runs(A)):
+            pass
+
+    def core_merge(A):
+        for _ in heap_core.merge(*runs(A)):
+            pass
+
+    # Se combinan 8 colas (una por worker) en una sola y se saca el tope
+    def l08_reinsert_merge(A):
+        shards = [L08.Heap(A[i::8], L08.HeapType.MIN) for i in range(8)]
+        h = shards[0]
+        for other in shards[1:]:
+            while not other.is_empty():
+                h.push(other.pop())
+        h.pop()
+
+    def pairing_meld(A):
+        shards = [pairing_heap.PairingHeap(A[i::8], L08.HeapType.MIN) for i in range(8)]
+        h = shards[0]
+        for other in shards[1:]:
+            h.meld(other)
+        h.pop()
+
+    def heapq_heapsort(A):
+        h = A[:]
+        heapq.heapify(h)
+        [heapq.heappop(h) for _ in range(len(h))]
+
+    return [
+        Case("L08.Heap.push_pop", "heap", "ints", l08_push_pop, None),
+        Case("L09.PriorityQueue.upsert_extract", "heap", "ints", l09_upsert_extract, None),
+        Case("heapq.push_pop", "heap", "ints", heapq_push_pop, None),
+        Case("heap_core.push_pop", "heap", "ints", core_push_pop, None),
+        Case("heapq.heapify", "heap", "ints", heapq_heapify, None),
+        Case("heap_core.heapify", "heap", "ints", core_heapify, None),
+        Case("heapq.pushpop", "heap", "ints", heapq_pushpop, None),
+        Case("heap_core.pushpop", "heap", "ints", core_pushpop, None),
+        Case("heapq.merge", "heap", "ints", heapq_merge, None),
+        Case("heap_core.merge", "heap", "ints", core_merge, None),
+        Case("heapq.heapsort", "sort", "ints", heapq_heapsort, None),
+        Case("L08.Heap.reinsert_merge", "heap", "ints", l08_reinsert_merge, None),
+        Case("pairing_heap.meld", "heap", "ints", pairing_meld, None),
+    ]
+
+
+# Variantes de L08.Heap: (etiqueta, arity, compact); "d=2" es la base para los crossovers
+HEAP_VARIANTS = [("d=2", 2, False), ("d=4", 4, False), ("d=8", 8, False), ("d=2,compact", 2, True), ("d=4,compact", 4, True)]
+HEAP_BASE = "d=2"
+
+
+def _heap_variant_cases() -> list[Case]:
+    L08 = load("Library/L08.py")
+
+    def push_heavy(arity, compact):
+        # Muchas inserciones y pocas extracciones (colas de eventos que crecen)
+        def run(A):
+            h = L08.Heap([], L08.HeapType.MIN, arity=arity, compact=compact)
+            for x in A:
+                h.push(x)
+            for _ in range(len(A) // 8):
+                h.pop()
+        return run
+
+    def pop_heavy(arity, compact):
+        # Se construye de golpe y se vacia
+        def run(A):
+            h = L08.Heap(A, L08.HeapType.MIN, arity=arity, compact=compact)
+            while not h.is_empty():
+                h.pop()
+        return run
+
+    return [
+        Case(f"L08.Heap[{label}].{workload.__name__}", "heap", "ints", workload(arity, compact), None)
+        for workload in (push_heavy, pop_heavy)
+        for label, arity, compact in HEAP_VARIANTS
+    ]
+
+
+def _tree_cases() -> list[Case]:
+    cases = []
+    for name, path, cls in [
+        ("L14.BST", "Library/L14.py", "BST"),
+        ("L17.AVL", "Library/L17 - avl.py", "AVL"),
+        ("L18.RBT", "Library/L18 - rbt.py", "RBT"),
+    ]:
+        tree_type = getattr(load(path), cls)
+
+        def insert_search(A, tree_type=tree_type):
+            t = tree_type()
+            for x in A:
+                t.insert(x)
+            for x in A:
+                t.search(x)
+
+        cases.append(Case(f"{name}.insert_search", "tree", "ints", insert_search, None))
+    return cases
+
+
+def _hash_cases() -> list[Case]:
+    L13 = load("Library/L13.py")
+
+    def insert_search(A):
+        m = max(1, len(A))
+        ht = L13.HashTable([], lambda e: hash(e) % m)
+        for x in A:
+            ht.insert(x)
+        for x in A:
+            ht.search(x)
+
+    return [Case("L13.HashTable.insert_search", "hash", "ints", insert_search, None)]
+
+
+def _graph_cases() -> list[Case]:
+    first = lambda G: G["nodes"][0]
+    return [
+        Case("L22.bfs", "graph", "graph", lambda G: G["L22"].bfs(first(G)), None),
+        Case("L22.bfs_result", "graph", "graph", lambda G: G["L22"].bfs_result(first(G)), None),
+        Case("L22.dfs", "graph", "graph", lambda G: G["L22"].dfs(), None),
+        Case("L22.topological_sort", "graph", "graph", lambda G: G["L22"].topological_sort(), None),
+        Case("L22.scc", "graph", "graph", lambda G: G["L22"].scc(), None),
+        Case("L23.kruskal", "graph", "graph", lambda G: G["L23"].kruskal(), None),
+        Case("L23.prim", "graph", "graph", lambda G: G["L23"].prim(first(G)), None),
+        Case("L24.dijkstra", "graph", "graph", lambda G: G["L24"].dijkstra(first(G)), None),
+        Case("L24.bellman_ford", "graph", "graph", lambda G: G["L24"].bellman_ford(first(G)), None),
+        Case("L24.dags", "graph", "graph", lambda G: G["L24"].dags(first(G)), None),
+        Case("CSR.dijkstra", "graph", "graph", lambda G: G["CSR"].dijkstra(first(G)), None),
+        Case("CSR.bellman_ford", "graph", "graph", lambda G: G["CSR"].bellman_ford(first(G)), None),
+        Case("CSR.scc", "graph", "graph", lambda G: G["CSR"].scc(), None),
+    ]
+
+
+def make_graphs(n: int, rng: random.Random) -> dict:
+    L22 = load("Library/L22 - graphs.py")
+    L23 = load("Library/L23.py")
+    L24 = load("Library/L24.py")
+    nodes = list(range(n))
+    # DAG disperso: aristas i -> j con i < j, unas 4 por nodo
+    edges = set()
+    target = min(4 * n, n * (n - 1) // 2)
+    while len(edges) < target:
+        i, j = sorted(rng.sample(nodes, 2))
+        edges.add((i, j))
+    weighted = [(i, j, rng.uniform(0.1, 1.0)) for i, j in edges]
+
+    G22 = L22.Graph(L22.GraphType.DIRECTED)
+    G22.add_nodes(nodes)
+    G22.add_edges(edges)
+    G23 = L23.Graph(L23.GraphType.UNDIRECTED)
+    G23.add_nodes(nodes)
+    G23.add_edges(weighted)
+    G24 = L24.Graph(L24.GraphType.DIRECTED)
+    G24.add_nodes(nodes)
+    G24.add_edges(weighted)
+    return {"nodes": nodes, "L22": G22, "L23": G23, "L24": G24, "CSR": G24.freeze()}
+
+
+def all_cases() -> list[Case]:
+    return _sort_cases() + _heap_cases() + _heap_variant_cases() + _tree_cases() + _hash_cases() + _graph_cases()
+
+
+def peak_memory(f, setup) -> int:
+    args = setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        f(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float:
+    # Pendiente de minimos cuadrados en escala log-log: t ~ c * n^k
+    points = [(math.log(n), math.log(t)) for n, t in points if t > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def run(cases: list[Case], sizes: list[int], repeat: int, seed: int, memory: bool = True) -> dict:
+    results = []
+    graphs = {}
+    for case in cases:
+        distributions = DISTRIBUTIONS if case.inputs == "ints" else {"random": None}
+        for dist, make in distributions.items():
+            for n in sizes:
+                if case.max_n is not None and n > case.max_n:
+                    continue
+                rng = random.Random(seed)
+                if case.inputs == "ints":
+                    data = make(n, rng)
+                    setup = lambda data=data: (list(data),)
+                else:
+                    if n not in graphs:
+                        graphs[n] = make_graphs(n, rng)
+                    setup = lambda G=graphs[n]: (G,)
+
+                row = {"case": case.name, "group": case.group, "distribution": dist, "n": n}
+                try:
+                    timed = timeit(repeat, setup=setup, verbose=False)(case.run)
+                    timed()
+                    row.update(timed.stats)
+                    if memory:
+                        row["peak_bytes"] = peak_memory(case.run, setup)
+                except Exception as e:
+                    row["error"] = f"{type(e).__name__}: {e}"
+                results.append(row)
+                print(_format_row(row), file=sys.stderr)
+
+    complexity = []
+    keys = sorted({(r["case"], r["distribution"]) for r in results})
+    for name, dist in keys:
+        points = [
+            (r["n"], r["median"])
+            for r in results
+            if r["case"] == name and r["distribution"] == dist and "median" in r
+        ]
+        complexity.append({"case": name, "distribution": dist, "exponent": fit_exponent(points)})
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": sizes,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+        "complexity": complexity,
+    }
+
+
+def crossovers(report: dict, base: str = HEAP_BASE) -> list[dict]:
+    # Casos "Nombre[variante].carga": primer n desde el cual la variante le gana a Nombre[base].carga
+    # en todos los tamanos medidos; None si nunca
+    medians = {(r["case"], r["distribution"], r["n"]): r["median"] for r in report["results"] if "median" in r}
+    found = []
+    for name, dist in sorted({(c, d) for c, d, _ in medians}):
+        if "[" not in name or "]." not in name or f"[{base}]." in name:
+            continue
+        head, rest = name.split("[", 1)
+        _, workload = rest.split("].", 1)
+        base_name = f"{head}[{base}].{workload}"
+        sizes = sorted(n for c, d, n in medians if c == name and d == dist and (base_name, d, n) in medians)
+        if not sizes:
+            continue
+        crossover = None
+        for n in reversed(sizes):
+            if medians[(name, dist, n)] >= medians[(base_name, dist, n)]:
+                break
+            crossover = n
+        found.append({"case": name, "distribution": dist, "base": base_name, "crossover": crossover})
+    return found
+
+
+def _format_row(row: dict) -> str:
+    head = f"{row['case']:<36} {row['distribution']:<10} n={row['n']:<7}"
+    if "error" in row:
+        return f"{head} {row['error']}"
+    memory = f" peak={row['peak_bytes'] / 1024:.1f}KiB" if "peak_bytes" in row else ""
+    return f"{head} min={row['min']:.6f} median={row['median']:.6f} p95={row['p95']:.6f}{memory}"
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    previous = {
+        (r["case"], r["distribution"], r["n"]): r
+        for r in baseline["results"]
+        if "median" in r
+    }
+    regressions = []
+    for r in current["results"]:
+        old = previous.get((r["case"], r["distribution"], r["n"]))
+        if old is None or "median" not in r or old["median"] <= 0:
+            continue
+        ratio = r["median"] / old["median"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{r['case']} [{r['distribution']}, n={r['n']}]: "
+                f"{old['median']:.6f}s -> {r['median']:.6f}s (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de AlgorithmStratsLibrary")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--group", choices=["sort", "heap", "tree", "hash", "graph"], action="append")
+    parser.add_argument("--case", action="append", help="substring del nombre del caso")
+    parser.add_argument("--no-memory", action="store_true", help="no medir memoria con tracemalloc")
+    parser.add_argument("--out", default="bench_output.json")
+    parser.add_argument("--baseline", help="JSON de una corrida anterior para detectar regresiones")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    cases = [
+        c
+        for c in all_cases()
+        if (not args.group or c.group in args.group)
+        and (not args.case or any(s in c.name for s in args.case))
+    ]
+    report = run(cases, sorted(args.sizes), args.repeat, args.seed, not args.no_memory)
+    report["crossovers"] = crossovers(report)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for c in report["complexity"]:
+        if c["exponent"] is not None:
+            print(f"{c['case']:<36} {c['distribution']:<10} ~ n^{c['exponent']:.2f}")
+    for c in report["crossovers"]:
+        when = f"n >= {c['crossover']}" if c["crossover"] is not None else "never"
+        print(f"{c['case']:<36} {c['distribution']:<10} faster than {c['base']}: {when}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
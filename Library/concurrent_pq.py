@@ -0,0 +1,270 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+from typing import List, Tuple, Callable, Iterable
+from L09 import PriorityQueue, HeapType
+
+# Colas de prioridad concurrentes sobre L09.PriorityQueue, con las mismas entradas (id, ...)
+# y la misma semantica de upsert: reinsertar un id existente solo cambia su prioridad
+# y no ocupa lugar extra, asi que nunca bloquea por capacidad.
+# maxsize <= 0 significa sin limite. put_many/get_many toman el lock una vez por lote.
+
+class ConcurrentPriorityQueue:
+    def __init__(self, A: List[Tuple[str, int]], queueType: HeapType, key: Callable, maxsize: int = 0):
+        self._pq = PriorityQueue(A, queueType, key)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pq)
+
+    def qsize(self):
+        return len(self)
+
+    def empty(self):
+        return len(self) == 0
+
+    def full(self):
+        with self._lock:
+            return self._full()
+
+    def _full(self):
+        return 0 < self.maxsize <= len(self._pq)
+
+    def _wait(self, cond, ready, block, timeout, exc):
+        # Llamar con el lock tomado
+        if ready():
+            return
+        if not block:
+            raise exc
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not cond.wait_for(ready, timeout):
+            raise exc
+
+    def put(self, e, block: bool = True, timeout: float = None) -> None:
+        with self._lock:
+            if not self._pq.contains(e[0]):
+                self._wait(self._not_full, lambda: not self._full(), block, timeout, Full)
+            self._pq.upsert(e)
+            self._not_empty.notify()
+
+    def put_nowait(self, e) -> None:
+        self.put(e, block=False)
+
+    def put_many(self, entries: Iterable, block: bool = True, timeout: float = None) -> None:
+        # timeout es para toda la llamada, no para cada espera (como en queue.Queue).
+        # Si se agota, las entradas ya insertadas se quedan en la cola
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+        with self._lock:
+            try:
+                for e in entries:
+                    if not self._pq.contains(e[0]) and self._full():
+                        # Antes de esperar se despierta a los consumidores de lo ya insertado
+                        self._not_empty.notify(added)
+                        added = 0
+                        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                        self._wait(self._not_full, lambda: not self._full(), block, remaining, Full)
+                    self._pq.upsert(e)
+                    added += 1
+            finally:
+                self._not_empty.notify(added)
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._lock:
+            self._wait(self._not_empty, lambda: len(self._pq) > 0, block, timeout, Empty)
+            e = self._pq.extract_extremum()
+            self._not_full.notify()
+            return e
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def get_many(self, n: int, block: bool = True, timeout: float = None) -> list:
+        # Espera a que haya al menos una entrada y saca hasta n, en orden de prioridad
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        with self._lock:
+            self._wait(self._not_empty, lambda: len(self._pq) > 0, block, timeout, Empty)
+            out = [self._pq.extract_extremum() for _ in range(min(n, len(self._pq)))]
+            self._not_full.notify(len(out))
+            return out
+
+    def remove(self, id):
+        with self._lock:
+            e = self._pq.remove(id)
+            if e is not None:
+                self._not_full.notify()
+            return e
+
+    def contains(self, id):
+        with self._lock:
+            return self._pq.contains(id)
+
+    def priority_of(self, id):
+        with self._lock:
+            return self._pq.priority_of(id)
+
+# Variante para asyncio: sin locks (todo corre en el hilo del event loop). Las corrutinas
+# que esperan se estacionan en futures y se despiertan una a una, sin sondeo.
+# Para un timeout se usa asyncio.wait_for / asyncio.timeout.
+
+class AsyncPriorityQueue:
+    def __init__(self, A: List[Tuple[str, int]], queueType: HeapType, key: Callable, maxsize: int = 0):
+        self._pq = PriorityQueue(A, queueType, key)
+        self.maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+
+    def __len__(self):
+        return len(self._pq)
+
+    def qsize(self):
+        return len(self._pq)
+
+    def empty(self):
+        return len(self._pq) == 0
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._pq)
+
+    def _wakeup_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _park(self, waiters, ready):
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Si ya se habia despertado a este waiter, el turno pasa al siguiente
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def put_nowait(self, e) -> None:
+        if not self._pq.contains(e[0]) and self.full():
+            raise asyncio.QueueFull
+        self._pq.upsert(e)
+        self._wakeup_next(self._getters)
+
+    async def put(self, e) -> None:
+        if not self._pq.contains(e[0]):
+            await self._park(self._putters, lambda: not self.full())
+        self.put_nowait(e)
+
+    async def put_many(self, entries: Iterable) -> None:
+        for e in entries:
+            if not self._pq.contains(e[0]) and self.full():
+                await self._park(self._putters, lambda: not self.full())
+            self.put_nowait(e)
+
+    def get_nowait(self):
+        if not self._pq.A:
+            raise asyncio.QueueEmpty
+        e = self._pq.extract_extremum()
+        self._wakeup_next(self._putters)
+        return e
+
+    async def get(self):
+        await self._park(self._getters, lambda: len(self._pq) > 0)
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> list:
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        await self._park(self._getters, lambda: len(self._pq) > 0)
+        out = [self._pq.extract_extremum() for _ in range(min(n, len(self._pq)))]
+        for _ in out:
+            self._wakeup_next(self._putters)
+        return out
+
+    def remove(self, id):
+        e = self._pq.remove(id)
+        if e is not None:
+            self._wakeup_next(self._putters)
+        return e
+
+    def contains(self, id):
+        return self._pq.contains(id)
+
+    def priority_of(self, id):
+        return self._pq.priority_of(id)
+
+if __name__ == "__main__":
+    from operator import itemgetter
+
+    # Hilos: un productor acotado por maxsize y dos consumidores
+    q = ConcurrentPriorityQueue([], HeapType.MIN, key=itemgetter(1), maxsize=4)
+    done = []
+
+    def consumer():
+        while True:
+            batch = q.get_many(3)
+            if batch[0][0] is None:
+                q.put((None, float("inf")))  # el centinela se deja para el otro consumidor
+                return
+            done.extend(batch)
+
+    workers = [threading.Thread(target=consumer) for _ in range(2)]
+    for w in workers:
+        w.start()
+    q.put_many((f"job{i}", i % 5) for i in range(20))
+    q.put((None, float("inf")))
+    for w in workers:
+        w.join()
+    print(len(done), len({e[0] for e in done}))  # 20 20
+
+    try:
+        ConcurrentPriorityQueue([], HeapType.MIN, key=itemgetter(1)).get(timeout=0.01)
+    except Empty:
+        print("Empty")  # Empty
+
+    full = ConcurrentPriorityQueue([("a", 1)], HeapType.MIN, key=itemgetter(1), maxsize=1)
+    full.put(("a", 0), timeout=0)  # upsert de un id existente: no necesita lugar
+    print(full.priority_of("a"))  # 0
+    try:
+        full.put(("b", 2), timeout=0.01)
+    except Full:
+        print("Full")  # Full
+
+    # asyncio: los consumidores esperan en futures hasta que llega trabajo
+    async def main():
+        aq = AsyncPriorityQueue([], HeapType.MAX, key=itemgetter(1), maxsize=2)
+        got = []
+
+        async def worker():
+            while (e := await aq.get())[0] is not None:
+                got.append(e)
+            await aq.put(e)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(2)]
+        await aq.put_many([("x", 1), ("y", 5), ("z", 3)])
+        await aq.put((None, -1))
+        await asyncio.gather(*tasks)
+        print(sorted(got))  # [('x', 1), ('y', 5), ('z', 3)]
+        try:
+            # aq todavia tiene el centinela: el timeout se prueba con una cola vacia
+            await asyncio.wait_for(AsyncPriorityQueue([], HeapType.MAX, key=itemgetter(1)).get(), 0.01)
+        except TimeoutError:
+            print("timeout")  # timeout
+
+    asyncio.run(main())
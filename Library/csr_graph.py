@@ -0,0 +1,526 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float("inf")
+
+
+class BFSResult:
+    def __init__(self, graph, source, distance: array, parent: array):
+        self.graph = graph
+        self.source = source
+        self.distance = distance
+        self.parent = parent
+
+    def __repr__(self):
+        return f"BFSResult(source={self.source!r}, reached={len(self.reached())})"
+
+    def reached(self) -> list:
+        labels = self.graph.labels
+        return [labels[i] for i, d in enumerate(self.distance) if d >= 0]
+
+    def distance_to(self, v) -> float:
+        d = self.distance[self.graph.index[v]]
+        return d if d >= 0 else INF
+
+    def parent_of(self, v):
+        p = self.parent[self.graph.index[v]]
+        return self.graph.labels[p] if p >= 0 else None
+
+    def path_to(self, v) -> list:
+        return self.graph.path(self.parent, self.source, v)
+
+
+class DFSResult:
+    def __init__(self, graph, discovered: array, finished: array, parent: array):
+        self.graph = graph
+        self.discovered = discovered
+        self.finished = finished
+        self.parent = parent
+
+    def __repr__(self):
+        return f"DFSResult(nodes={len(self.discovered)})"
+
+    def discovered_at(self, v) -> int:
+        return self.discovered[self.graph.index[v]]
+
+    def finished_at(self, v) -> int:
+        return self.finished[self.graph.index[v]]
+
+    def parent_of(self, v):
+        p = self.parent[self.graph.index[v]]
+        return self.graph.labels[p] if p >= 0 else None
+
+
+class CSRGraph:
+    def __init__(
+        self,
+        labels: list,
+        offsets: array,
+        targets: array,
+        weights: array,
+        directed: bool = True,
+    ):
+        self.labels = labels
+        self.index = {v: i for i, v in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self._transpose: CSRGraph = None
+
+    def __getstate__(self):
+        # El indice y la transpuesta se reconstruyen del otro lado
+        return (self.labels, self.offsets, self.targets, self.weights, self.directed)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def from_edges(cls, nodes, edges, directed: bool = True):
+        labels = list(nodes)
+        index = {v: i for i, v in enumerate(labels)}
+        n = len(labels)
+        src, dst, wts = array("q"), array("q"), array("d")
+
+        for e in edges:
+            u, v = index[e[0]], index[e[1]]
+            w = e[2] if len(e) > 2 else 1.0
+            src.append(u)
+            dst.append(v)
+            wts.append(w)
+            if not directed and u != v:
+                src.append(v)
+                dst.append(u)
+                wts.append(w)
+
+        # Conteo de grados y suma prefija para obtener los offsets
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        m = len(src)
+        targets = array("q", bytes(8 * m))
+        weights = array("d", bytes(8 * m))
+        cursor = offsets[:-1]
+        for u, v, w in zip(src, dst, wts):
+            k = cursor[u]
+            targets[k] = v
+            weights[k] = w
+            cursor[u] = k + 1
+        return cls(labels, offsets, targets, weights, directed)
+
+    def __repr__(self):
+        return f"CSRGraph(nodes={len(self)}, edges={self.edge_count()})"
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, u: int) -> array:
+        return self.targets[self.offsets[u] : self.offsets[u + 1]]
+
+    def to_numpy(self):
+        import numpy as np
+
+        # Vistas sin copia sobre los buffers de los arreglos
+        return (
+            np.frombuffer(self.offsets, dtype=np.int64),
+            np.frombuffer(self.targets, dtype=np.int64),
+            np.frombuffer(self.weights, dtype=np.float64),
+        )
+
+    def transpose(self):
+        if not self.directed:
+            return self
+        if self._transpose is None:
+            n = len(self)
+            offsets = self.offsets
+            self._transpose = CSRGraph.from_edges(
+                range(n),
+                (
+                    (self.targets[k], u, self.weights[k])
+                    for u in range(n)
+                    for k in range(offsets[u], offsets[u + 1])
+                ),
+            )
+            self._transpose.labels = self.labels
+            self._transpose.index = self.index
+        return self._transpose
+
+    def path(self, parent: array, s, v) -> list:
+        s, v = self.index[s], self.index[v]
+        path = []
+        while v != -1:
+            path.append(self.labels[v])
+            if v == s:
+                path.reverse()
+                return path
+            v = parent[v]
+        return []
+
+    # Breadth First Search (BFS)
+    def bfs(self, s) -> BFSResult:
+        n = len(self)
+        offsets, targets = self.offsets, self.targets
+        distance = array("q", [-1]) * n
+        parent = array("q", [-1]) * n
+        source, s = s, self.index[s]
+        distance[s] = 0
+        q = deque([s])
+
+        while q:
+            u = q.popleft()
+            d = distance[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if distance[v] < 0:
+                    distance[v] = d
+                    parent[v] = u
+                    q.append(v)
+        return BFSResult(self, source, distance, parent)
+
+    # Depth First Search (DFS) con pila explicita
+    def dfs(self) -> DFSResult:
+        n = len(self)
+        offsets, targets = self.offsets, self.targets
+        discovered = array("q", [0]) * n
+        finished = array("q", [0]) * n
+        parent = array("q", [-1]) * n
+        time = 0
+
+        for r in range(n):
+            if discovered[r]:
+                continue
+            time += 1
+            discovered[r] = time
+            # Cada entrada guarda el nodo y la siguiente arista por revisar
+            stack = [(r, offsets[r])]
+            while stack:
+                u, k = stack[-1]
+                end = offsets[u + 1]
+                while k < end and discovered[targets[k]]:
+                    k += 1
+                if k < end:
+                    v = targets[k]
+                    stack[-1] = (u, k + 1)
+                    parent[v] = u
+                    time += 1
+                    discovered[v] = time
+                    stack.append((v, offsets[v]))
+                else:
+                    stack.pop()
+                    time += 1
+                    finished[u] = time
+        return DFSResult(self, discovered, finished, parent)
+
+    def dijkstra(self, s, goals=None) -> tuple[array, array]:
+        n = len(self)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        d = array("d", [INF]) * n
+        parent = array("q", [-1]) * n
+        s = self.index[s]
+        d[s] = 0.0
+        heap = [(0.0, s)]
+        # Si se dan destinos, se termina en cuanto todos quedan fijos
+        pending = {self.index[t] for t in goals} if goals is not None else None
+
+        while heap:
+            du, u = heapq.heappop(heap)
+            if du > d[u]:
+                continue
+            if pending is not None:
+                pending.discard(u)
+                if not pending:
+                    break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                dv = du + weights[k]
+                if dv < d[v]:
+                    d[v] = dv
+                    parent[v] = u
+                    heapq.heappush(heap, (dv, v))
+        return d, parent
+
+    def bidirectional_dijkstra(self, s, t) -> tuple[float, list]:
+        if s == t:
+            return 0.0, [s]
+        s, t = self.index[s], self.index[t]
+        sides = (
+            (self, {s: 0.0}, {s: -1}, [(0.0, s)]),
+            (self.transpose(), {t: 0.0}, {t: -1}, [(0.0, t)]),
+        )
+        best, meet = INF, -1
+
+        while sides[0][3] and sides[1][3]:
+            # Ningun camino sin explorar puede mejorar al mejor encontrado
+            if sides[0][3][0][0] + sides[1][3][0][0] >= best:
+                break
+            side = 0 if sides[0][3][0][0] <= sides[1][3][0][0] else 1
+            G, d, parent, heap = sides[side]
+            other = sides[1 - side][1]
+            du, u = heapq.heappop(heap)
+            if du > d[u]:
+                continue
+            offsets, targets, weights = G.offsets, G.targets, G.weights
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                dv = du + weights[k]
+                if dv < d.get(v, INF):
+                    d[v] = dv
+                    parent[v] = u
+                    heapq.heappush(heap, (dv, v))
+                    if v in other and dv + other[v] < best:
+                        best, meet = dv + other[v], v
+
+        if meet < 0:
+            return INF, []
+        forward, backward = sides[0][2], sides[1][2]
+        path = []
+        v = meet
+        while v != -1:
+            path.append(self.labels[v])
+            v = forward[v]
+        path.reverse()
+        v = backward[meet]
+        while v != -1:
+            path.append(self.labels[v])
+            v = backward[v]
+        return best, path
+
+    def shortest_paths(self, s, goals) -> dict:
+        goals = list(goals)
+        d, parent = self.dijkstra(s, goals)
+        paths = {}
+        for t in goals:
+            i = self.index[t]
+            paths[(s, t)] = (d[i], self.path(parent, s, t) if d[i] < INF else [])
+        return paths
+
+    def bellman_ford(self, s, mode: str = "batch") -> tuple[array, array, list]:
+        if mode == "spfa":
+            return self._spfa(s)
+        if mode != "batch":
+            raise ValueError(f"Unknown Bellman-Ford mode: {mode}")
+        if np is not None:
+            return self._bellman_ford_numpy(s)
+
+        n = len(self)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        d = array("d", [INF]) * n
+        parent = array("q", [-1]) * n
+        d[self.index[s]] = 0.0
+
+        passes = 0
+        while True:
+            changed = False
+            for u in range(n):
+                du = d[u]
+                if du == INF:
+                    continue
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if du + weights[k] < d[v]:
+                        d[v] = du + weights[k]
+                        parent[v] = u
+                        changed = True
+            passes += 1
+            # Si una pasada no cambia nada, ya se tienen las distancias finales
+            if not changed:
+                return d, parent, []
+            if passes >= n:
+                cycle = self._parent_cycle(parent)
+                if cycle:
+                    return d, parent, cycle
+
+    def _bellman_ford_numpy(self, s) -> tuple[array, array, list]:
+        n = len(self)
+        offsets, targets, weights = self.to_numpy()
+        sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+        # Las aristas se agrupan por destino para reducir con minimum.reduceat
+        order = np.argsort(targets, kind="stable")
+        u, v, w = sources[order], targets[order], weights[order]
+        starts = np.flatnonzero(np.r_[True, v[1:] != v[:-1]]) if len(v) else v
+        heads = v[starts]
+
+        d = np.full(n, INF)
+        d[self.index[s]] = 0.0
+        parent = np.full(n, -1, dtype=np.int64)
+        best = np.full(n, INF)
+        cycle = []
+
+        passes = 0
+        while len(v):
+            candidate = d[u] + w
+            best.fill(INF)
+            best[heads] = np.minimum.reduceat(candidate, starts)
+            improved = best < d
+            passes += 1
+            if not improved.any():
+                break
+            # Para cada nodo mejorado se toma una arista que alcanza el minimo
+            hit = improved[v] & (candidate == best[v])
+            parent[v[hit]] = u[hit]
+            d = np.where(improved, best, d)
+            if passes >= n:
+                cycle = self._parent_cycle(parent)
+                if cycle:
+                    break
+
+        return array("d", d.tobytes()), array("q", parent.tobytes()), cycle
+
+    # Shortest Path Faster Algorithm: solo se revisan los nodos que cambiaron
+    def _spfa(self, s) -> tuple[array, array, list]:
+        n = len(self)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        d = array("d", [INF]) * n
+        parent = array("q", [-1]) * n
+        length = array("q", [0]) * n
+        in_queue = bytearray(n)
+        s = self.index[s]
+        d[s] = 0.0
+        q = deque([s])
+        in_queue[s] = 1
+
+        while q:
+            u = q.popleft()
+            in_queue[u] = 0
+            du = d[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if du + weights[k] < d[v]:
+                    d[v] = du + weights[k]
+                    parent[v] = u
+                    length[v] = length[u] + 1
+                    # Un camino con n aristas repite un nodo
+                    if length[v] >= n:
+                        cycle = self._parent_cycle(parent)
+                        if cycle:
+                            return d, parent, cycle
+                    if not in_queue[v]:
+                        in_queue[v] = 1
+                        q.append(v)
+        return d, parent, []
+
+    def _parent_cycle(self, parent) -> list:
+        n = len(self)
+        stamp = array("q", [-1]) * n
+        for i in range(n):
+            v = i
+            while v != -1 and stamp[v] == -1:
+                stamp[v] = i
+                v = int(parent[v])
+            if v == -1 or stamp[v] != i:
+                continue
+            # v esta en un ciclo de padres; se recorre en sentido de las aristas
+            cycle = [self.labels[v]]
+            u = int(parent[v])
+            while u != v:
+                cycle.append(self.labels[u])
+                u = int(parent[u])
+            cycle.append(self.labels[v])
+            cycle.reverse()
+            return cycle
+        return []
+
+    # Strongly Connected Components (SCC) con Tarjan iterativo
+    def scc(self) -> list[list]:
+        n = len(self)
+        offsets, targets = self.offsets, self.targets
+        order = array("q", [-1]) * n
+        low = array("q", [0]) * n
+        on_stack = bytearray(n)
+        stack = []
+        sccs = []
+        counter = 0
+
+        for r in range(n):
+            if order[r] >= 0:
+                continue
+            order[r] = low[r] = counter
+            counter += 1
+            stack.append(r)
+            on_stack[r] = 1
+            work = [(r, offsets[r])]
+            while work:
+                u, k = work[-1]
+                end = offsets[u + 1]
+                descended = False
+                while k < end:
+                    v = targets[k]
+                    k += 1
+                    if order[v] < 0:
+                        work[-1] = (u, k)
+                        order[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        on_stack[v] = 1
+                        work.append((v, offsets[v]))
+                        descended = True
+                        break
+                    if on_stack[v] and order[v] < low[u]:
+                        low[u] = order[v]
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    p = work[-1][0]
+                    if low[u] < low[p]:
+                        low[p] = low[u]
+                # u es raiz de una componente
+                if low[u] == order[u]:
+                    component = []
+                    while True:
+                        v = stack.pop()
+                        on_stack[v] = 0
+                        component.append(self.labels[v])
+                        if v == u:
+                            break
+                    sccs.append(component)
+        return sccs
+
+
+# Grafo de solo lectura compartido por los procesos del pool
+_shared_graph: CSRGraph = None
+
+
+def _init_worker(graph: CSRGraph) -> None:
+    global _shared_graph
+    _shared_graph = graph
+
+
+def _paths_from(sources: list, goals: list) -> dict:
+    paths = {}
+    for s in sources:
+        paths.update(_shared_graph.shortest_paths(s, goals))
+    return paths
+
+
+def shortest_paths_many(
+    graph: CSRGraph, sources, goals, workers: int = None, chunk_size: int = 16
+) -> dict:
+    sources, goals = list(sources), list(goals)
+    if workers == 1 or len(sources) <= chunk_size:
+        paths = {}
+        for s in sources:
+            paths.update(graph.shortest_paths(s, goals))
+        return paths
+
+    # Cada tarea es un Dijkstra por fuente que para al fijar todos los destinos
+    chunks = [sources[i : i + chunk_size] for i in range(0, len(sources), chunk_size)]
+    paths = {}
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(graph,)) as pool:
+        for result in pool.map(_paths_from, chunks, [goals] * len(chunks)):
+            paths.update(result)
+    return paths
@@ -0,0 +1,168 @@
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterator
+
+from L08 import Heap, HeapType
+from L10 import merge_sort
+
+# Mismo formato que Clientes.txt: campos separados por tabuladores, un registro por linea
+def parse_record(line: str) -> tuple[str, ...]:
+    return tuple(e.strip() for e in line.rstrip("\n").split("\t"))
+
+def record_key(line: str, key: Callable = None):
+    record = parse_record(line)
+    return key(record) if key else record
+
+def field_key(record: tuple[str, ...], field: int, numeric: bool = False):
+    value = record[field] if field < len(record) else ""
+    return float(value) if numeric else value
+
+def parse_size(size: str) -> int:
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    size = size.strip().upper().rstrip("B")
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+# Bytes por linea que agrega el ordenamiento ademas de la linea y su llave: la tupla (llave, indice)
+# y el indice de cached_sort, los huecos en las listas y el buffer de merge_sort (n/2)
+DECORATION_BYTES = 144
+# Cada cuantas lineas se mide el tamano real de la llave ya parseada
+KEY_SAMPLE_EVERY = 64
+
+def object_size(x) -> int:
+    if isinstance(x, tuple):
+        return sys.getsizeof(x) + sum(object_size(e) for e in x)
+    return sys.getsizeof(x)
+
+def read_chunks(path: str, chunk_bytes: int, encoding: str, key: Callable = None) -> Iterator[list[str]]:
+    # Se leen bloques de lineas cuyo costo en memoria al ordenarlas no pasa de chunk_bytes:
+    # la linea (sys.getsizeof), su llave parseada (promedio de una muestra) y DECORATION_BYTES
+    chunk, size = [], 0
+    key_bytes, sampled, key_mean = 0, 0, 0
+    with open(path, encoding=encoding) as f:
+        for n, line in enumerate(f):
+            if not line.endswith("\n"):
+                line += "\n"
+            if n % KEY_SAMPLE_EVERY == 0:
+                key_bytes += object_size(record_key(line, key))
+                sampled += 1
+                key_mean = key_bytes // sampled
+            chunk.append(line)
+            size += sys.getsizeof(line) + key_mean + DECORATION_BYTES
+            if size >= chunk_bytes:
+                yield chunk
+                chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+def sort_run(lines: list[str], key: Callable, tmp_dir: str, encoding: str) -> str:
+    # merge_sort evalua la llave una sola vez por linea (key caching)
+    merge_sort(lines, key=partial(record_key, key=key))
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "w", encoding=encoding) as f:
+        f.writelines(lines)
+    return path
+
+def merge_runs(paths: list[str], out, key: Callable, encoding: str) -> None:
+    files = [open(p, encoding=encoding) for p in paths]
+    try:
+        # El indice del run desempata, asi el merge es estable
+        heap = Heap([], HeapType.MIN)
+        for i, f in enumerate(files):
+            line = f.readline()
+            if line:
+                heap.push((record_key(line, key), i, line))
+
+        while not heap.is_empty():
+            _, i, line = heap.pop()
+            out.write(line)
+            line = files[i].readline()
+            if line:
+                heap.push((record_key(line, key), i, line))
+    finally:
+        for f in files:
+            f.close()
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    key: Callable = None,
+    memory_limit: int = 64 << 20,
+    workers: int = 1,
+    max_fan_in: int = 64,
+    tmp_dir: str = None,
+    encoding: str = "utf-8",
+) -> None:
+    # memory_limit es la memoria para ordenar los runs (lineas, llaves y decoracion), no el tamano del texto.
+    # Con workers > 1 la llave viaja a los procesos con pickle: debe ser una funcion de modulo
+    # o un functools.partial de una (como field_key en la linea de comandos), no una lambda
+    if workers > 1 and key is not None:
+        try:
+            pickle.dumps(key)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                "key must be picklable when workers > 1: use a module-level function or functools.partial"
+            ) from e
+    # Cada worker ordena un run a la vez, asi que el presupuesto se reparte entre ellos
+    chunk_bytes = max(1, memory_limit // max(1, workers))
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        # 1. Runs ordenados en archivos temporales
+        if workers > 1:
+            runs = []
+            with ProcessPoolExecutor(workers) as pool:
+                pending = []
+                for chunk in read_chunks(input_path, chunk_bytes, encoding, key):
+                    pending.append(pool.submit(sort_run, chunk, key, run_dir, encoding))
+                    # No se leen mas bloques de los que se pueden ordenar a la vez
+                    if len(pending) >= workers:
+                        runs.append(pending.pop(0).result())
+                runs.extend(f.result() for f in pending)
+        else:
+            runs = [
+                sort_run(chunk, key, run_dir, encoding) for chunk in read_chunks(input_path, chunk_bytes, encoding, key)
+            ]
+
+        # 2. Merge de k vias, en varias pasadas si hay mas runs que max_fan_in
+        while len(runs) > max_fan_in:
+            merged = []
+            for i in range(0, len(runs), max_fan_in):
+                group = runs[i : i + max_fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+                with os.fdopen(fd, "w", encoding=encoding) as out:
+                    merge_runs(group, out, key, encoding)
+                for p in group:
+                    os.remove(p)
+                merged.append(path)
+            runs = merged
+
+        with open(output_path, "w", encoding=encoding) as out:
+            merge_runs(runs, out, key, encoding)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ordena archivos separados por tabuladores mas grandes que la RAM")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--key-field", type=int, help="campo (desde 0) usado como llave; por defecto todo el registro")
+    parser.add_argument("--numeric", action="store_true", help="compara la llave como numero")
+    parser.add_argument("--memory", default="64M", help="presupuesto de memoria para los runs, e.g. 512M o 2G")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max-fan-in", type=int, default=64)
+    parser.add_argument("--tmp-dir")
+    args = parser.parse_args()
+
+    key = partial(field_key, field=args.key_field, numeric=args.numeric) if args.key_field is not None else None
+    external_sort(
+        args.input,
+        args.output,
+        key=key,
+        memory_limit=parse_size(args.memory),
+        workers=args.workers,
+        max_fan_in=args.max_fan_in,
+        tmp_dir=args.tmp_dir,
+    )
@@ -0,0 +1,220 @@
+from typing import TypeVar, Callable, Iterable, Iterator
+from sort_keys import identity
+
+T = TypeVar("T")
+
+# Nucleo de heap binario 0-indexado compartido por L08, L09, heapsort2, E08.1 y Monticulos.
+# Trabaja sobre dos listas paralelas: los items y sus llaves, calculadas una sola vez.
+# Con la llave identidad keys puede ser la misma lista que items.
+# Los sift son iterativos y recorren un hueco: cada paso es una sola asignacion, sin intercambios.
+# index (opcional) guarda la posicion de cada item: index[ident(item)] = i
+# arity es el numero de hijos por nodo: un heap d-ario es menos alto (log_d n niveles)
+
+def sift_up(
+    items: list, keys: list, i: int, max_heap: bool = False, index: dict = None, ident: Callable = identity, arity: int = 2
+) -> int:
+    item, k = items[i], keys[i]
+    while i > 0:
+        p = (i - 1) // arity
+        kp = keys[p]
+        if not (kp < k if max_heap else k < kp):
+            break
+        items[i] = items[p]
+        keys[i] = kp
+        if index is not None:
+            index[ident(items[i])] = i
+        i = p
+    items[i] = item
+    keys[i] = k
+    if index is not None:
+        index[ident(item)] = i
+    return i
+
+def sift_down(
+    items: list,
+    keys: list,
+    i: int,
+    n: int = None,
+    max_heap: bool = False,
+    index: dict = None,
+    ident: Callable = identity,
+    arity: int = 2,
+) -> int:
+    # Solo se consideran las primeras n posiciones (heap_sort deja lo ordenado al final)
+    if n is None:
+        n = len(items)
+    item, k = items[i], keys[i]
+    while True:
+        c = arity * i + 1
+        if c >= n:
+            break
+        kc = keys[c]
+        if arity == 2:
+            if c + 1 < n:
+                kr = keys[c + 1]
+                if kc < kr if max_heap else kr < kc:
+                    c += 1
+                    kc = kr
+        else:
+            # El hijo mas extremo de los d
+            for j in range(c + 1, min(c + arity, n)):
+                kj = keys[j]
+                if kc < kj if max_heap else kj < kc:
+                    c = j
+                    kc = kj
+        if not (k < kc if max_heap else kc < k):
+            break
+        items[i] = items[c]
+        keys[i] = kc
+        if index is not None:
+            index[ident(items[i])] = i
+        i = c
+    items[i] = item
+    keys[i] = k
+    if index is not None:
+        index[ident(item)] = i
+    return i
+
+def update(
+    items: list, keys: list, i: int, max_heap: bool = False, index: dict = None, ident: Callable = identity, arity: int = 2
+) -> int:
+    # La llave en i cambio: el item sube o baja, segun haga falta
+    j = sift_up(items, keys, i, max_heap, index, ident, arity)
+    if j == i:
+        j = sift_down(items, keys, i, None, max_heap, index, ident, arity)
+    return j
+
+def heapify(
+    items: list, keys: list, max_heap: bool = False, index: dict = None, ident: Callable = identity, arity: int = 2
+) -> None:
+    # Floyd: O(n), hundiendo desde el ultimo nodo interno
+    for i in range((len(items) - 2) // arity, -1, -1):
+        sift_down(items, keys, i, None, max_heap, None, identity, arity)
+    if index is not None:
+        index.clear()
+        index.update((ident(x), i) for i, x in enumerate(items))
+
+def push(
+    items: list,
+    keys: list,
+    item: T,
+    key_value,
+    max_heap: bool = False,
+    index: dict = None,
+    ident: Callable = identity,
+    arity: int = 2,
+) -> int:
+    # La llave va primero: si no cabe en keys (e.g. array('d')) el heap queda intacto
+    if keys is not items:
+        keys.append(key_value)
+    items.append(item)
+    return sift_up(items, keys, len(items) - 1, max_heap, index, ident, arity)
+
+def pop(
+    items: list, keys: list, max_heap: bool = False, index: dict = None, ident: Callable = identity, arity: int = 2
+) -> T:
+    return remove(items, keys, 0, max_heap, index, ident, arity)
+
+def remove(
+    items: list, keys: list, i: int, max_heap: bool = False, index: dict = None, ident: Callable = identity, arity: int = 2
+) -> T:
+    # El ultimo item ocupa el lugar del que sale y se reacomoda desde ahi
+    if not items:
+        raise IndexError("pop from empty heap")
+    item = items[i]
+    if index is not None:
+        del index[ident(item)]
+    last = items.pop()
+    last_key = keys.pop() if keys is not items else last
+    if i < len(items):
+        items[i] = last
+        keys[i] = last_key
+        update(items, keys, i, max_heap, index, ident, arity)
+    return item
+
+def pushpop(
+    items: list,
+    keys: list,
+    item: T,
+    key_value,
+    max_heap: bool = False,
+    index: dict = None,
+    ident: Callable = identity,
+    arity: int = 2,
+) -> T:
+    # push seguido de pop, con un solo sift; si el item nuevo ya es el extremo ni se inserta
+    if not items or not (key_value < keys[0] if max_heap else keys[0] < key_value):
+        return item
+    return replace(items, keys, item, key_value, max_heap, index, ident, arity)
+
+def replace(
+    items: list,
+    keys: list,
+    item: T,
+    key_value,
+    max_heap: bool = False,
+    index: dict = None,
+    ident: Callable = identity,
+    arity: int = 2,
+) -> T:
+    # pop seguido de push: sale la raiz aunque el item nuevo sea mas extremo
+    if not items:
+        raise IndexError("replace on empty heap")
+    root = items[0]
+    keys[0] = key_value
+    if index is not None:
+        del index[ident(root)]
+    items[0] = item
+    sift_down(items, keys, 0, None, max_heap, index, ident, arity)
+    return root
+
+def merge(*iterables: Iterable[T], key: Callable = None, reverse: bool = False) -> Iterator[T]:
+    # Merge de k vias de iterables ya ordenados; en empates sale primero el del iterable anterior.
+    # Como en heapq.merge, key=None compara los valores mismos
+    if key is None:
+        key = identity
+    items, keys = [], []
+    for r, it in enumerate(map(iter, iterables)):
+        for value in it:
+            items.append((value, it))
+            keys.append((key(value), -r if reverse else r))
+            break
+    heapify(items, keys, reverse)
+
+    while items:
+        value, it = items[0]
+        r = keys[0][1]
+        yield value
+        for value in it:
+            items[0] = (value, it)
+            keys[0] = (key(value), r)
+            sift_down(items, keys, 0, None, reverse)
+            break
+        else:
+            pop(items, keys, reverse)
+
+def heap_sort(A: list[T], key: Callable = identity, reverse: bool = False) -> None:
+    # En su lugar: max-heap para orden ascendente, la raiz se manda al final en cada paso
+    keys = A if key is identity else [key(x) for x in A]
+    max_heap = not reverse
+    heapify(A, keys, max_heap)
+    for end in range(len(A) - 1, 0, -1):
+        item, k = A[end], keys[end]
+        A[end] = A[0]
+        keys[end] = keys[0]
+        A[0] = item
+        keys[0] = k
+        sift_down(A, keys, 0, end, max_heap)
+
+if __name__ == "__main__":
+    A = [5, 3, 8, 1, 9, 2]
+    heapify(A, A)
+    print(A[0])  # 1
+    push(A, A, 0, 0)
+    print(pop(A, A), pop(A, A))  # 0 1
+    print(pushpop(A, A, 4, 4), replace(A, A, 7, 7))  # 2 3
+    print(list(merge([1, 4, 7], [2, 5, 8], [3, 6, 9])))  # [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    B = ["uva", "manzana", "kiwi", "platanos"]
+    heap_sort(B, key=len, reverse=True)
+    print(B)  # ['platanos', 'manzana', 'kiwi', 'uva']
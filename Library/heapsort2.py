@@ -1,31 +1,16 @@
-def heapify(arr, n, i):
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-
-    if left < n and arr[left] > arr[largest]:
-        largest = left
+import heap_core
 
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+def heapify(arr, n, i):
+    # Hunde arr[i] en el max-heap arr[:n]
+    heap_core.sift_down(arr, arr, i, n, max_heap=True)
 
 def build_max_heap(arr):
-    n = len(arr)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
+    heap_core.heapify(arr, arr, max_heap=True)
 
 def heap_sort(arr):
-    n = len(arr)
-    build_max_heap(arr)
-    
-    for i in range(n - 1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        heapify(arr, i, 0)
+    heap_core.heap_sort(arr)
 
-arr = [12, 11, 13, 5, 6, 7]
-heap_sort(arr)
-print("Arreglo ordenado:", arr)
+if __name__ == "__main__":
+    arr = [12, 11, 13, 5, 6, 7]
+    heap_sort(arr)
+    print("Arreglo ordenado:", arr)
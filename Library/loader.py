@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+
+LIBRARY = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(LIBRARY)
+
+# Los modulos de Library se importan entre si (e.g. csr_graph)
+if LIBRARY not in sys.path:
+    sys.path.insert(0, LIBRARY)
+
+
+def load(path: str):
+    # Carga un modulo por su ruta, aunque el archivo tenga espacios en el nombre:
+    # "Library/L02 - insertion.py" se registra como el modulo "L02"
+    name = os.path.splitext(os.path.basename(path))[0].split(" ")[0]
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
@@ -0,0 +1,203 @@
+from typing import TypeVar, Callable, Iterable, Optional
+from sort_keys import identity
+from L08 import HeapType
+
+T = TypeVar("T")
+
+# Heap de emparejamiento (pairing heap): un arbol multi-camino donde cada nodo
+# apunta a su primer hijo y a su hermano siguiente; prev es el padre si el nodo
+# es primer hijo, o el hermano anterior en otro caso.
+# meld y push son O(1); pop es O(log n) amortizado (dos pasadas de emparejamiento);
+# decrease_key corta el subarbol y lo enlaza con la raiz.
+
+class _Owner:
+    # Marca del heap dueno de cada nodo. meld no recorre los nodos absorbidos: la marca del
+    # heap absorbido apunta a la del otro y los nodos se re-marcan al usarse (como en union-find)
+    __slots__ = ("parent",)
+
+    def __init__(self) -> None:
+        self.parent = None
+
+    def find(self) -> "_Owner":
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        node = self
+        while node.parent is not None:
+            node.parent, node = root, node.parent
+        return root
+
+class Node:
+    __slots__ = ("item", "key", "child", "sibling", "prev", "owner")
+
+    def __init__(self, item: T, key, owner: _Owner = None) -> None:
+        self.item = item
+        self.key = key
+        self.child = None
+        self.sibling = None
+        self.prev = None
+        self.owner = owner
+
+    def __repr__(self) -> str:
+        return f"Node({self.item!r})"
+
+class PairingHeap:
+    def __init__(
+        self,
+        A: Iterable[T] = (),
+        heapType: HeapType = HeapType.MAX,
+        key: Callable[[T], any] = identity,
+    ) -> None:
+        self.type = heapType
+        self._key = key
+        self._root = None
+        self._size = 0
+        self._owner = _Owner()
+        for x in A:
+            self.push(x)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"PairingHeap(size={self._size}, top={self._root.item if self._root else None!r})"
+
+    def _before(self, a, b) -> bool:
+        # True si la llave a debe ir arriba de b
+        return a > b if self.type == HeapType.MAX else a < b
+
+    def _link(self, a: Node, b: Node) -> Node:
+        # Dos raices: la perdedora pasa a ser el primer hijo de la ganadora
+        if self._before(b.key, a.key):
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        return a
+
+    def _merge_pairs(self, first: Optional[Node]) -> Optional[Node]:
+        # Dos pasadas: se enlazan los hermanos por parejas de izquierda a derecha
+        # y luego se acumulan de derecha a izquierda. Iterativo, sin recursion.
+        pairs = []
+        while first is not None:
+            a = first
+            b = a.sibling
+            if b is None:
+                a.prev = a.sibling = None
+                pairs.append(a)
+                break
+            first = b.sibling
+            a.prev = a.sibling = b.prev = b.sibling = None
+            pairs.append(self._link(a, b))
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _cut(self, node: Node) -> None:
+        # Separa el subarbol de node de su padre o hermano anterior
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+    def _check(self, node: Node) -> None:
+        if node.owner is None:
+            raise ValueError("node is not in the heap")
+        node.owner = node.owner.find()
+        if node.owner is not self._owner:
+            raise ValueError("node belongs to a different heap")
+
+    def size(self) -> int:
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self._root is None
+
+    def push(self, item: T) -> Node:
+        # Devuelve el nodo, que sirve como handle para decrease_key y delete
+        node = Node(item, self._key(item), self._owner)
+        self._root = node if self._root is None else self._link(self._root, node)
+        self._size += 1
+        return node
+
+    def peek(self) -> T:
+        if self._root is None:
+            raise IndexError("peek from empty heap")
+        return self._root.item
+
+    def pop(self) -> T:
+        if self._root is None:
+            raise IndexError("pop from empty heap")
+        root = self._root
+        self._root = self._merge_pairs(root.child)
+        root.child = None
+        root.owner = None
+        self._size -= 1
+        return root.item
+
+    def meld(self, other: "PairingHeap") -> None:
+        # Absorbe other en O(1); other queda vacio y sus handles pasan a este heap
+        if other is self:
+            return
+        if other.type != self.type:
+            raise ValueError("cannot meld heaps of different types")
+        if other._key is not self._key:
+            raise ValueError("cannot meld heaps with different keys")
+        if other._root is not None:
+            self._root = other._root if self._root is None else self._link(self._root, other._root)
+            self._size += other._size
+        other._owner.parent = self._owner
+        other._owner = _Owner()
+        other._root = None
+        other._size = 0
+
+    def decrease_key(self, node: Node, item: T) -> None:
+        # "Decrease" en el sentido del heap: la nueva llave sube hacia la raiz
+        # (menor en un MIN, mayor en un MAX)
+        self._check(node)
+        k = self._key(item)
+        if self._before(node.key, k):
+            raise ValueError("new key moves the item away from the root")
+        node.item = item
+        node.key = k
+        if node is self._root:
+            return
+        self._cut(node)
+        self._root = self._link(self._root, node)
+
+    def delete(self, node: Node) -> T:
+        self._check(node)
+        if node is self._root:
+            return self.pop()
+        self._cut(node)
+        rest = self._merge_pairs(node.child)
+        node.child = None
+        node.owner = None
+        if rest is not None:
+            self._root = self._link(self._root, rest)
+        self._size -= 1
+        return node.item
+
+if __name__ == "__main__":
+    h = PairingHeap([5, 1, 8, 3], HeapType.MIN)
+    print(h.peek())  # 1
+    other = PairingHeap([7, 0, 4], HeapType.MIN)
+    h.meld(other)
+    print(len(h), len(other))  # 7 0
+    print([h.pop() for _ in range(len(h))])  # [0, 1, 3, 4, 5, 7, 8]
+
+    # Handles: decrease_key sube una tarea en la cola
+    tasks = PairingHeap(heapType=HeapType.MAX, key=lambda t: t[1])
+    handles = {name: tasks.push((name, p)) for name, p in [("a", 3), ("b", 7), ("c", 5), ("d", 1)]}
+    tasks.decrease_key(handles["d"], ("d", 9))
+    print(tasks.delete(handles["c"]))  # ('c', 5)
+    print([tasks.pop() for _ in range(len(tasks))])  # [('d', 9), ('b', 7), ('a', 3)]
@@ -0,0 +1,125 @@
+import heapq
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar, Callable
+
+from loader import load
+from sort_keys import identity
+
+T = TypeVar("T")
+
+# Se pasan por nombre para que cada proceso cargue el modulo por su cuenta
+ALGORITHMS = {
+    "merge": ("Library/L10.py", "merge_sort"),
+    "quick": ("Library/L11.py", "quick_sort"),
+    "shell": ("Library/L03 - shell.py", "shell_sort"),
+    "insertion": ("Library/L02 - insertion.py", "insertion_sort"),
+    "selection": ("Library/L04 - selection.py", "selection_sort"),
+    "heap": ("Library/heapsort2.py", "heap_sort"),
+}
+
+MIN_PARALLEL = 10_000
+OVERSAMPLE = 32
+
+def get_algorithm(name: str) -> Callable:
+    path, function = ALGORITHMS[name]
+    return getattr(load(path), function)
+
+def pack_keys(keys: list) -> tuple[str, object]:
+    # Llaves numericas viajan como el buffer de un array; las demas se envian como lista
+    if all(type(k) is int for k in keys):
+        try:
+            return "q", array("q", keys).tobytes()
+        except OverflowError:
+            return None, keys
+    if all(type(k) in (int, float) for k in keys):
+        return "d", array("d", keys).tobytes()
+    return None, keys
+
+def sort_bucket(algorithm: str, typecode: str, keys, indexes: bytes) -> bytes:
+    if typecode is not None:
+        keys = array(typecode, keys)
+    # Los pares (llave, indice) son unicos, asi que cualquier algoritmo queda estable
+    pairs = list(zip(keys, array("q", indexes)))
+    get_algorithm(algorithm)(pairs)
+    return array("q", [i for _, i in pairs]).tobytes()
+
+def parallel_sort(
+    A: list[T],
+    key: Callable = identity,
+    reverse: bool = False,
+    workers: int = None,
+    algorithm: str = "merge",
+    mode: str = "sample",
+) -> None:
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if mode not in ("sample", "chunks"):
+        raise ValueError(f"Unknown mode: {mode}")
+    workers = workers or os.cpu_count() or 1
+    n = len(A)
+    keys = [key(x) for x in A]
+    # Con reverse se usa -i: al invertir el resultado los empates quedan en orden original
+    sign = -1 if reverse else 1
+
+    if workers == 1 or n < MIN_PARALLEL:
+        pairs = [(k, sign * i) for i, k in enumerate(keys)]
+        get_algorithm(algorithm)(pairs)
+        order = [i for _, i in pairs]
+    elif mode == "sample":
+        order = sample_sort(keys, sign, workers, algorithm)
+    else:
+        order = chunk_sort(keys, sign, workers, algorithm)
+
+    if reverse:
+        order.reverse()
+    A[:] = [A[sign * i] for i in order]
+
+def sample_sort(keys: list, sign: int, workers: int, algorithm: str) -> list[int]:
+    # Separadores tomados de una muestra: cada bucket cubre un rango de llaves
+    sample = sorted(random.sample(keys, min(len(keys), workers * OVERSAMPLE)))
+    splitters = sample[OVERSAMPLE::OVERSAMPLE][: workers - 1]
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for i, k in enumerate(keys):
+        buckets[bisect_right(splitters, k)].append(sign * i)
+
+    with ProcessPoolExecutor(workers) as pool:
+        futures = []
+        for bucket in buckets:
+            typecode, payload = pack_keys([keys[sign * i] for i in bucket])
+            futures.append(pool.submit(sort_bucket, algorithm, typecode, payload, array("q", bucket).tobytes()))
+        # Los buckets no se traslapan: basta con concatenarlos
+        order = []
+        for f in futures:
+            order.extend(array("q", f.result()))
+    return order
+
+def chunk_sort(keys: list, sign: int, workers: int, algorithm: str) -> list[int]:
+    n = len(keys)
+    size = -(-n // workers)
+    with ProcessPoolExecutor(workers) as pool:
+        futures = []
+        for start in range(0, n, size):
+            typecode, payload = pack_keys(keys[start : start + size])
+            indexes = array("q", [sign * i for i in range(start, min(n, start + size))])
+            futures.append(pool.submit(sort_bucket, algorithm, typecode, payload, indexes.tobytes()))
+        runs = [array("q", f.result()) for f in futures]
+
+    # Merge de k vias de los pedazos ordenados
+    merged = heapq.merge(*[[(keys[sign * i], i) for i in run] for run in runs])
+    return [i for _, i in merged]
+
+if __name__ == "__main__":
+    A = [random.randrange(1_000_000) for _ in range(200_000)]
+    B = A[:]
+    parallel_sort(B, workers=4)
+    print(B == sorted(A))
+    # True
+    C = [(random.randrange(100), i) for i in range(50_000)]
+    D = C[:]
+    parallel_sort(D, key=lambda x: x[0], reverse=True, workers=4, algorithm="quick")
+    print(D == sorted(C, key=lambda x: x[0], reverse=True))
+    # True
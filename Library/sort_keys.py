@@ -0,0 +1,93 @@
+from enum import Enum
+from typing import TypeVar, Callable
+
+T = TypeVar("T")
+
+def identity(x: T) -> T:
+    return x
+
+class SortOrder(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+class Descending:
+    # Invierte las comparaciones de la llave que envuelve
+    __slots__ = ("value",)
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Descending({self.value!r})"
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other) -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other) -> bool:
+        return self.value < other.value
+
+    def __le__(self, other) -> bool:
+        return other.value <= self.value
+
+    def __ge__(self, other) -> bool:
+        return self.value <= other.value
+
+def descending_values(values: list) -> list:
+    # La estrategia se elige una vez para todas las llaves: si todas son int o float se niegan
+    # (comparar tuplas de numeros es mucho mas rapido); si no, todas se envuelven en Descending.
+    # Mezclar numeros negados con llaves envueltas haria comparar un int contra un Descending
+    if all(isinstance(v, (int, float)) for v in values):
+        return [-v for v in values]
+    return [Descending(v) for v in values]
+
+def descending(key: Callable) -> Callable:
+    return lambda x: Descending(key(x))
+
+def _spec_parts(spec) -> list[tuple[Callable, SortOrder]]:
+    parts = [(key, SortOrder(order)) for key, order in spec]
+    if not parts:
+        raise ValueError("Empty sort spec")
+    return parts
+
+def composite_key(spec: list[tuple[Callable, SortOrder | str]]) -> Callable:
+    # [(key1, "asc"), (key2, SortOrder.DESC)] -> una sola llave compuesta (tupla)
+    parts = _spec_parts(spec)
+
+    def key(x):
+        return tuple(k(x) if order is SortOrder.ASC else Descending(k(x)) for k, order in parts)
+
+    return key
+
+def sort_key(key) -> Callable:
+    # Para las rutas sin cached_sort: una especificacion de varias llaves se vuelve una funcion
+    return key if callable(key) else composite_key(key)
+
+def cached_sort(A: list[T], sort: Callable, key: Callable, reverse: bool = False, **kwargs) -> list[T]:
+    # Decorate-sort-undecorate: key() se evalua una sola vez por elemento.
+    # El indice desempata, asi que el orden de los empates es el original; con reverse
+    # la llave se invierte y se ordena ascendente, sin invertir la lista al final.
+    # key tambien puede ser una especificacion de varias llaves (ver composite_key).
+    parts = [(key, SortOrder.ASC)] if callable(key) else _spec_parts(key)
+    if reverse and key is identity and A and type(A[0]) in (int, float) and all(type(x) is type(A[0]) for x in A):
+        # Solo numeros de un tipo: basta con negarlos, los empates no se distinguen
+        negated = [-x for x in A]
+        sort(negated, key=identity, reverse=False, cache_keys=False, **kwargs)
+        A[:] = [-x for x in negated]
+        return A
+
+    # Una columna por llave; las descendentes (o invertidas por reverse) se invierten completas
+    columns = []
+    for k, order in parts:
+        column = [k(x) for x in A]
+        if (order is SortOrder.DESC) != reverse:
+            column = descending_values(column)
+        columns.append(column)
+    decorated = list(zip(*columns, range(len(A))))
+
+    sort(decorated, key=identity, reverse=False, cache_keys=False, **kwargs)
+
+    A[:] = [A[d[-1]] for d in decorated]
+    return A
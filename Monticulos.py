@@ -1,54 +1,31 @@
 # Implementa una cola de prioridad basada en monticulos binarios
 # y utilizala para generar una funcion que ordene un arreglo de cadenas de texto
-class Max_Heap:
-    def _init_(self):
-        self.heap = []
+import os
+import sys
 
-    # Define al nodo padre
-    def parent(self, i):
-        return (i - 1) // 2
+# El nucleo del heap vive en Library/heap_core.py
+LIBRARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Library")
+if LIBRARY not in sys.path:
+    sys.path.insert(0, LIBRARY)
+import heap_core
 
-    # Define al nodo izquierdo
-    def left_child(self, i):
-        return 2 * i + 1
-
-    # Define al nodo derecho
-    def right_child(self, i):
-        return 2 * i + 2
+class Max_Heap:
+    def __init__(self):
+        self.heap = []
 
     # Ordena el monticulo maximo segun el nodo i
     def heapify(self, i):
-        big = i
-        left = self.left_child(i)
-        right = self.right_child(i)
-
-        if left < len(self.heap) and self.heap[left] > self.heap[big]:
-            big = left
-        if right < len(self.heap) and self.heap[right] > self.heap[big]:
-            big = right
-        if big != i:
-            self.heap[i], self.heap[big] = self.heap[big], self.heap[i]
-            self.heapify(big)
+        heap_core.sift_down(self.heap, self.heap, i, max_heap=True)
 
     # Agrega y ordena un nuevo elemento
     def insert(self, element):
-        self.heap.append(element)
-        i = len(self.heap) - 1
-        while i > 0 and self.heap[i] > self.heap[self.parent(i)]:
-            self.heap[i], self.heap[self.parent(i)] = self.heap[self.parent(i)], self.heap[i]
-            i = self.parent(i)
+        heap_core.push(self.heap, self.heap, element, element, max_heap=True)
 
     # Obtiene el elemento raiz
     def get_max(self):
         if not self.heap:
             return None
-        if len(self.heap) == 1:
-            return self.heap.pop()
-
-        max_val = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self.heapify(0)
-        return max_val
+        return heap_core.pop(self.heap, self.heap, max_heap=True)
 
     def is_empty(self):
         return len(self.heap) == 0
@@ -67,10 +44,11 @@ def ord_texto(palabras):
     return array_ord[::-1]
 
 # Ejemplos de ejecucion
-helados = ['Vainilla', 'Chocolate', 'Menta', 'Oreo']
-ordenar = ord_texto(helados)
-print(ordenar)
-
-nombres = ['Natalia', 'Francisco', 'Luis', 'Paulina']
-order = ord_texto(nombres)
-print(order)
\ No newline at end of file
+if __name__ == "__main__":
+    helados = ['Vainilla', 'Chocolate', 'Menta', 'Oreo']
+    ordenar = ord_texto(helados)
+    print(ordenar)
+
+    nombres = ['Natalia', 'Francisco', 'Luis', 'Paulina']
+    order = ord_texto(nombres)
+    print(order)
\ No newline at end of file
@@ -1,18 +1,32 @@
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #sección 1; Algoritmos de ordenamiento..
 #a) Ordenamiento por shell (Shell sort).
+#usa los gaps de Ciura (1, 4, 10, 23, 57, ... x2.25) en lugar de size/2, size/4, ...
 def shell_sort(list):
     size = len(list)
-    gap = size//2
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < size:
+        gaps.append(int(gaps[-1] * 2.25))
 
-    while gap > 0:
+    for gap in reversed(gaps):
+        if gap >= size:
+            continue
         for i in range(gap,size):
             anchor = list[i]
             j = i
-            while(list[j-gap]>anchor and j>=gap):
+            while(j>=gap and list[j-gap]>anchor):
                 list[j] = list[j-gap]
                 j-=gap
             list[j]=anchor
-        gap = gap//2
     return(list)
 
     # En el mejor caso (n log n), el arreglo ya está ordenado o casi ordenado, hay menos comparaciones y movimientos
@@ -22,6 +36,7 @@ def shell_sort(list):
     #Mejor	Ω(n log n) el arreglo está casi ordenado
     #Promedio	Θ(n log n)
     #Peor	O(n²) el arreglo está en orden inverso
+    #con los gaps de Ciura el peor caso no se conoce con exactitud, pero en la practica es cercano a O(n^(4/3))
 
 
 #b) Ordenamiento por selecci ́on (Selection sort).
@@ -53,22 +68,73 @@ def selection_sort(list):
 
 
 #c) Ordenamiento por conteo (Counting sort).
-def counting_sort(list):
-    max1 = max(list)
-
-    lista_ordenada = [0] * len(list)
-    lista_numeros = [0] * (max1 + 1)
-
+#los conteos se desplazan por el minimo: acepta negativos y no reserva max+1 casillas.
+#si el rango (max-min) es grande comparado con n se cuenta con un dict o se usa radix.
+COUNTING_RANGE_FACTOR = 4
+
+def _frequencies(list, lo, hi, always=False):
+    # Regresa los pares (valor, veces) en orden ascendente, o None si conviene radix
+    # (con always=True nunca regresa None)
+    n = len(list)
+    if hi - lo <= COUNTING_RANGE_FACTOR * n:
+        lista_numeros = [0] * (hi - lo + 1)
+        for num in list:
+            lista_numeros[num - lo] += 1
+        return [(lo + i, c) for i, c in enumerate(lista_numeros) if c]
+
+    # Rango grande: solo se cuentan (y ordenan) los valores distintos
+    freq = {}
     for num in list:
-        lista_numeros[num] += 1
-
-    for i in range(1, max1 + 1):
-        lista_numeros[i] += lista_numeros[i - 1]
-
-    for num in reversed(list):
-        lista_ordenada[lista_numeros[num] - 1] = num
-        lista_numeros[num] -= 1
+        freq[num] = freq.get(num, 0) + 1
+    if 2 * len(freq) > n and not always:
+        return None
+    return sorted(freq.items())
+
+def _radix_sort_offset(list, lo):
+    # Radix base 256 sobre num - lo, para cuando casi todos los valores son distintos
+    values = [num - lo for num in list]
+    top = max(values)
+    shift = 0
+    while top >> shift:
+        buckets = [[] for _ in range(256)]
+        for v in values:
+            buckets[(v >> shift) & 255].append(v)
+        values = [v for bucket in buckets for v in bucket]
+        shift += 8
+    return [v + lo for v in values]
+
+def counts(list):
+    # Frecuencias por valor, sin la pasada de reconstruccion
+    if not list:
+        return []
+    return _frequencies(list, min(list), max(list), always=True)
+
+def histogram(list, bins=10):
+    # Conteos por intervalos [bordes[b], bordes[b+1]) de igual ancho entre min y max
+    if bins < 1:
+        raise ValueError("bins must be at least 1")
+    if not list:
+        return [], []
+    lo, hi = min(list), max(list)
+    width = hi - lo + 1
+    # El valor v cae en el bin (v - lo) * bins // width, asi que cada borde es el techo de width * b / bins
+    bordes = [lo + -(-width * b // bins) for b in range(bins + 1)]
+    conteos = [0] * bins
+    for value, c in counts(list):
+        conteos[(value - lo) * bins // width] += c
+    return bordes, conteos
 
+def counting_sort(list):
+    if not list:
+        return []
+    lo, hi = min(list), max(list)
+    pairs = _frequencies(list, lo, hi)
+    if pairs is None:
+        return _radix_sort_offset(list, lo)
+
+    lista_ordenada = []
+    for value, c in pairs:
+        lista_ordenada.extend([value] * c)
     return lista_ordenada
 
     #El mejor caso es cuando todos los elementos de la lista son iguales,
@@ -145,29 +211,61 @@ def radix_sort(list):
     #mejor, peor y caso promedio = O(b*(N+10)) = O(b*(N))
 
 #e) Ordenamiento por intervalos (Bucket sort).
-def bucket_sort(list):
+#los bordes de los buckets salen de cuantiles de una muestra, asi datos sesgados se reparten parejo.
+#buckets chicos se ordenan con insercion y los grandes con bucket sort recursivo.
+BUCKET_INSERTION_CUTOFF = 32
+BUCKET_OVERSAMPLE = 4
+MAX_BUCKETS = 1024
+
+def _insertion_sort_pairs(pairs):
+    # Compara solo la llave: los pares (llave, elemento) quedan estables
+    for i in range(1, len(pairs)):
+        anchor = pairs[i]
+        j = i
+        while j > 0 and pairs[j - 1][0] > anchor[0]:
+            pairs[j] = pairs[j - 1]
+            j -= 1
+        pairs[j] = anchor
+    return pairs
+
+def _bucket_sort_pairs(pairs, workers=1):
+    n = len(pairs)
+    if n <= BUCKET_INSERTION_CUTOFF:
+        return _insertion_sort_pairs(pairs)
+
+    # Bordes tomados de los cuantiles de una muestra ordenada
+    size = min(MAX_BUCKETS, n // BUCKET_INSERTION_CUTOFF + 1)
+    sample = sorted(k for k, _ in random.sample(pairs, min(n, size * BUCKET_OVERSAMPLE)))
+    bordes = []
+    for b in range(1, size):
+        k = sample[b * len(sample) // size]
+        if not bordes or bordes[-1] < k:
+            bordes.append(k)
+
+    buckets = [[] for _ in range(len(bordes) + 1)]
+    for pair in pairs:
+        buckets[bisect_right(bordes, pair[0])].append(pair)
+
+    # Si todo cayo en un solo bucket la recursion no avanza (e.g. muchas llaves repetidas)
+    if any(len(bucket) == n for bucket in buckets):
+        return sorted(pairs, key=itemgetter(0))
+
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            buckets = pool.map(_bucket_sort_pairs, buckets)
+    else:
+        buckets = [_bucket_sort_pairs(bucket) for bucket in buckets]
 
-        # Encontrar el valor máximo y mínimo para normalizar los datos
-    min_val = min(list)
-    max_val = max(list)
-    bucket_range = (max_val - min_val) / len(list)  # Rango de cada bucket
-
-    # Crear buckets vacíos
-    buckets = [[] for _ in range(len(list))]
-
-    # Colocar elementos en los buckets correspondientes
-    for num in list:
-        index = int((num - min_val) / bucket_range) if bucket_range > 0 else 0
-        if index == len(list):  # Manejo de valores en el límite superior
-            index -= 1
-        buckets[index].append(num)
-
-    # Ordenar cada bucket individualmente e insertar de nuevo en el array
     sorted_arr = []
     for bucket in buckets:
-        sorted_arr.extend(sorted(bucket))  # Usando sorted() (puede ser cambiado por otro algoritmo)
+        sorted_arr.extend(bucket)
+    return sorted_arr
+
+def bucket_sort(list, key=None, workers=1):
+    # Regresa una lista nueva; la llave se evalua una sola vez por elemento
+    pairs = [(key(x) if key else x, x) for x in list]
+    return [x for _, x in _bucket_sort_pairs(pairs, workers)]
 
-    return list
     #el mejor caso es cuando los elementos están distribuidos de manera ordenada en los cubos,
     #y cada cubo contiene solo un elemento o un número más pequeño.
     #Asi el proceso solo hace la inserción de los elementos en los cubos y despue slos acomoda en arreglo
@@ -187,11 +285,98 @@ def bucket_sort(list):
     #el rendimiento de este algoritmo depende del acomodo de los datos
     #en la mayoría de los casos, el rendimiento se acerca a O(n), validando el análisis a priori.
 
-
-
-list=[170,45,75,90,802,24,2,66]
-print(counting_sort(list))
-print(radix_sort(list))
-print(shell_sort(list))
-print(selection_sort(list))
-print(bucket_sort(list))
\ No newline at end of file
+    #con bordes por cuantiles el peor caso de un solo bucket grande ya no depende de la distribucion:
+    #cada nivel parte en hasta 1024 buckets, y si no logra partir se ordena con sorted() O(n log n)
+
+
+#f) Versiones vectorizadas con NumPy (counting y radix).
+#trabajan sobre arreglos enteros de NumPy, incluyendo negativos y llaves de 64 bits.
+def _integer_array(A):
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized sorts")
+    a = np.ascontiguousarray(A)
+    if not np.issubdtype(a.dtype, np.integer):
+        raise TypeError(f"Expected an integer array, got {a.dtype}")
+    return a
+
+def _unsigned_keys(a):
+    # Se invierte el bit de signo: el orden sin signo coincide con el orden con signo
+    udt = np.dtype(f"u{a.dtype.itemsize}")
+    u = a.view(udt)
+    if np.issubdtype(a.dtype, np.signedinteger):
+        u = u ^ udt.type(1 << (8 * a.dtype.itemsize - 1))
+    # Restar el minimo reduce el numero de digitos (y de pasadas)
+    return u - u.min()
+
+def counting_sort_np(A, return_indices=False):
+    a = _integer_array(A)
+    if a.size == 0:
+        return np.empty(0, dtype=np.intp) if return_indices else a.copy()
+    lo, hi = int(a.min()), int(a.max())
+    span = hi - lo
+    # Si el rango es grande comparado con n, el arreglo de conteos no vale la pena
+    if span >= max(2 * a.size, 1 << 16):
+        return radix_sort_np(a, return_indices=return_indices)
+    # Desplazado por el minimo: los conteos empiezan en 0 aunque haya negativos
+    offsets = _unsigned_keys(a)
+    if return_indices:
+        if span >= 1 << 16:
+            return radix_sort_np(a, return_indices=True)
+        # El argsort estable de NumPy sobre uint8/uint16 es un radix de una pasada: O(n + k)
+        return np.argsort(offsets.astype(np.uint8 if span < 1 << 8 else np.uint16), kind="stable")
+    counts = np.bincount(offsets.astype(np.intp), minlength=span + 1)
+    # Aritmetica modular en uint64 para que lo + k no se desborde en ningun dtype
+    values = np.arange(span + 1, dtype=np.uint64) + np.uint64(lo % (1 << 64))
+    return np.repeat(values.astype(a.dtype), counts)
+
+    #O(n + k) igual que counting_sort, pero el conteo y la reconstruccion son vectorizados
+
+def radix_sort_np(A, digit_bits=16, return_indices=False):
+    if digit_bits not in (8, 16):
+        raise ValueError("digit_bits must be 8 or 16")
+    a = _integer_array(A)
+    if a.size == 0:
+        return np.empty(0, dtype=np.intp) if return_indices else a.copy()
+    digit_type = np.uint8 if digit_bits == 8 else np.uint16
+    u = _unsigned_keys(a)
+    if u.dtype.itemsize * 8 < digit_bits:
+        u = u.astype(digit_type)
+    mask = u.dtype.type((1 << digit_bits) - 1)
+
+    # LSD: digito por digito (base 256 o 65536) desde el menos significativo
+    order = np.arange(a.size, dtype=np.intp)
+    for shift in range(0, int(u.max()).bit_length(), digit_bits):
+        digits = (u >> u.dtype.type(shift)) & mask
+        # Si todos comparten el digito la pasada no cambia nada
+        if digits.min() == digits.max():
+            continue
+        order = order[np.argsort(digits[order].astype(digit_type), kind="stable")]
+
+    return order if return_indices else a[order]
+
+    #cada pasada es O(n) (argsort estable de enteros de 8/16 bits es radix)
+    #con llaves de b bits: O(n * b/16) con digitos de 16 bits, 4 pasadas para 64 bits en el peor caso
+    #los digitos constantes (e.g. bits altos de ids pequenos) se saltan
+
+
+if __name__ == "__main__":
+    list=[170,45,75,90,802,24,2,66]
+    print(counting_sort(list))
+    print(counting_sort([7, -3, 10**9, 7, 0]))
+    # [-3, 0, 7, 7, 1000000000]
+    print(counts([3, 1, 3, -2]))
+    # [(-2, 1), (1, 1), (3, 2)]
+    print(histogram(list, bins=4))
+    # ([2, 203, 403, 603, 803], [7, 0, 0, 1])
+    print(radix_sort(list))
+    print(shell_sort(list))
+    print(selection_sort(list))
+    print(bucket_sort(list))
+    print(bucket_sort([0.5, -1.25, 3.0, 0.5, 2], key=abs))
+    # [0.5, 0.5, -1.25, 2, 3.0]
+    if np is not None:
+        ids = np.array([170, -45, 75, 2**40, 802, -24, 2, 66], dtype=np.int64)
+        print(counting_sort_np(ids))
+        print(radix_sort_np(ids, digit_bits=8))
+        print(radix_sort_np(ids, return_indices=True))
+        # [1 5 6 7 2 0 4 3]